@@ -0,0 +1,73 @@
+import os
+from collections import OrderedDict
+from functools import lru_cache
+from threading import Lock
+from typing import Any, Hashable, Optional
+
+from diskcache import Cache
+
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'kami-dv')
+CACHE_EXPIRE = 30 * 24 * 60 * 60
+CACHE_NAMES = ('cep', 'cnpj')
+MEMO_SIZE = 100_000
+
+
+@lru_cache(maxsize=None)
+def get_cache(name: str) -> Cache:
+    """
+    Return the persistent cache used for a kind of webservice lookup.
+
+    Caches are opened lazily, so importing the package does not touch the
+    filesystem. Entries are keyed by ``(webservice, sanitized_id)``.
+
+    Args:
+        name (str): The lookup kind, one of ``CACHE_NAMES``.
+
+    Returns:
+        Cache: The disk cache stored under ``CACHE_DIR/<name>``.
+    """
+    return Cache(os.path.join(CACHE_DIR, name))
+
+
+def cache_clear() -> None:
+    """Remove every cached CEP and CNPJ webservice result."""
+    for name in CACHE_NAMES:
+        get_cache(name).clear()
+
+
+class LRUCache:
+    """
+    Bounded in-memory mapping that evicts the least recently used entry.
+
+    Args:
+        maxsize (int): The maximum number of entries kept.
+    """
+
+    def __init__(self, maxsize: int = MEMO_SIZE):
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the value stored for ``key``, or None when missing."""
+        with self._lock:
+            if key not in self._data:
+                return None
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store ``value`` for ``key``, evicting the oldest entry if full."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,203 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+)
+
+import httpx
+
+T = TypeVar('T')
+HTTP_TIMEOUT = 10.0
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.5
+HTTP2_AVAILABLE = find_spec('h2') is not None
+
+
+def run_sync(coroutine: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    When an event loop is already running in the current thread (e.g. inside
+    a Jupyter notebook) ``asyncio.run`` refuses to start, so the coroutine is
+    executed on a fresh loop in a worker thread instead.
+
+    Args:
+        coroutine (Coroutine): The coroutine to execute.
+
+    Returns:
+        The value returned by the coroutine.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+
+class AsyncRateLimiter:
+    """
+    Async context manager spacing entries evenly over time.
+
+    Each entry is given the next free slot on a fixed schedule of one entry
+    every ``time_period / max_rate`` seconds, so no more than ``max_rate``
+    entries happen in any ``time_period`` window regardless of how long the
+    guarded calls take.
+
+    Args:
+        max_rate (float): The number of entries allowed per ``time_period``.
+        time_period (float): The length of the window, in seconds.
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 1.0):
+        if max_rate <= 0 or time_period < 0:
+            raise ValueError(
+                'max_rate must be positive and time_period non-negative.'
+            )
+        self.interval = time_period / max_rate
+        self._next_slot = 0.0
+
+    async def __aenter__(self) -> None:
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+
+def _client_options(max_connections: int, timeout: float) -> Dict[str, Any]:
+    return {
+        'limits': httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        ),
+        'timeout': timeout,
+        'http2': HTTP2_AVAILABLE,
+    }
+
+
+def create_client(
+    max_connections: int = 10, timeout: float = HTTP_TIMEOUT
+) -> httpx.Client:
+    """
+    Create an HTTP client with a pool of ``max_connections`` connections,
+    all kept alive for reuse across requests.
+
+    HTTP/2 is negotiated when the ``h2`` package is installed, letting
+    requests to the same host share one connection. Brotli-compressed
+    responses are accepted when ``brotli`` is installed.
+
+    Args:
+        max_connections (int): The size of the connection pool.
+        timeout (float): The timeout of each request, in seconds.
+
+    Returns:
+        httpx.Client: The configured client.
+    """
+    return httpx.Client(**_client_options(max_connections, timeout))
+
+
+def create_async_client(
+    max_connections: int = 10, timeout: float = HTTP_TIMEOUT
+) -> httpx.AsyncClient:
+    """
+    Create an async HTTP client whose connection pool matches the number of
+    requests allowed in flight, keeping every connection alive for reuse.
+
+    Args:
+        max_connections (int): The size of the connection pool.
+        timeout (float): The timeout of each request, in seconds.
+
+    Returns:
+        httpx.AsyncClient: The configured client.
+    """
+    return httpx.AsyncClient(**_client_options(max_connections, timeout))
+
+
+async def get_with_backoff(
+    client: httpx.AsyncClient,
+    url: str,
+    max_retries: int = MAX_RETRIES,
+    backoff: float = RETRY_BACKOFF,
+) -> httpx.Response:
+    """
+    GET ``url``, retrying with exponential backoff while the server answers
+    429 Too Many Requests.
+
+    The wait honours a numeric ``Retry-After`` header and otherwise doubles
+    from ``backoff`` seconds on each attempt. Any other response, or the
+    last 429 once ``max_retries`` is exhausted, is returned to the caller.
+
+    Args:
+        client (httpx.AsyncClient): The client used for the request.
+        url (str): The URL to fetch.
+        max_retries (int): The number of retries after the first attempt.
+        backoff (float): The first wait, in seconds.
+
+    Returns:
+        httpx.Response: The last response received.
+    """
+    for attempt in range(max_retries + 1):
+        response = await client.get(url)
+        if response.status_code != 429 or attempt == max_retries:
+            return response
+        retry_after = response.headers.get('Retry-After', '')
+        await asyncio.sleep(
+            float(retry_after)
+            if retry_after.isdigit()
+            else backoff * 2**attempt
+        )
+
+
+async def gather_limited(
+    function: Callable[[Any], Awaitable[T]],
+    items: Iterable[Any],
+    concurrency: int = 10,
+    rate_limiter: Optional[AsyncRateLimiter] = None,
+) -> List[T]:
+    """
+    Await ``function`` over ``items`` concurrently.
+
+    ``concurrency`` workers pull items from a shared iterator, so exactly
+    that many calls are kept in flight and each result is stored as soon as
+    it arrives, without creating a pending task per item upfront. When a
+    ``rate_limiter`` is given, calls start no faster than it allows.
+
+    Args:
+        function (Callable): The coroutine function applied to each item.
+        items (Iterable): The items to process.
+        concurrency (int): The maximum number of calls in flight.
+        rate_limiter (Optional[AsyncRateLimiter]): Paces the calls.
+
+    Returns:
+        List: The results, in the order of ``items``.
+    """
+    items = list(items)
+    results: List[Optional[T]] = [None] * len(items)
+    pending = iter(enumerate(items))
+
+    async def worker() -> None:
+        for index, item in pending:
+            if rate_limiter is None:
+                results[index] = await function(item)
+            else:
+                async with rate_limiter:
+                    results[index] = await function(item)
+
+    await asyncio.gather(
+        *(worker() for _ in range(min(concurrency, len(items))))
+    )
+    return results
@@ -1,3 +1,5 @@
+import re
+
 KEY_TRANSLATIONS = {
     'cep': 'cep',
     'logradouro': 'street',
@@ -35,3 +37,28 @@ VALID_UFS = {
     'SE',
     'TO',
 }
+DOCUMENT_SEPARATORS = {
+    'cep': r'[-. ]',
+    'cpf': r'[.,-]',
+    'cnpj': r'[./,-]',
+}
+DOCUMENT_PATTERNS = {
+    'cep': r'\d{8}',
+    'cpf': r'\d{11}',
+    'cnpj': r'\d{14}',
+    'phone': r'(?!.*[^\W\d_])(?:\D*\d){8}.*',
+}
+CHECK_DIGIT_WEIGHTS = {
+    'cpf': (tuple(range(10, 1, -1)), tuple(range(11, 1, -1))),
+    'cnpj': (
+        (5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2),
+        (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2),
+    ),
+}
+COMPILED_PATTERNS = {
+    name: re.compile(pattern, re.ASCII)
+    for name, pattern in DOCUMENT_PATTERNS.items()
+}
+# Phone numbers only need at least 8 digits and no letters; their digits may
+# be any Unicode digits, which phonenumbers normalizes itself.
+COMPILED_PATTERNS['phone'] = re.compile(DOCUMENT_PATTERNS['phone'], re.DOTALL)
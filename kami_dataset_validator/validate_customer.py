@@ -1,12 +1,36 @@
 import logging
-import time
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import Callable, Dict, List, Optional, Tuple
 
 import polars as pl
 
-from kami_dataset_validator.validators.cep import Address, CepAPI
-from kami_dataset_validator.validators.cnpj import CnpjAPI, CNPJValidator
-from kami_dataset_validator.validators.cpf import CPFValidator
+from kami_dataset_validator.cache import CACHE_EXPIRE, get_cache
+from kami_dataset_validator.concurrency import AsyncRateLimiter, run_sync
+from kami_dataset_validator.constants import (
+    CHECK_DIGIT_WEIGHTS,
+    DOCUMENT_PATTERNS,
+    DOCUMENT_SEPARATORS,
+    VALID_UFS,
+)
+from kami_dataset_validator.validators.cep import (
+    Address,
+    CepAPI,
+    CEPFormatError,
+)
+from kami_dataset_validator.validators.cnpj import (
+    CNPJ_EMPTY_ERROR,
+    CNPJ_FORMAT_ERROR,
+    CNPJ_INVALID_ERROR,
+    CNPJ_LENGTH_ERROR,
+    CnpjAPI,
+)
+from kami_dataset_validator.validators.cpf import (
+    CPF_EMPTY_ERROR,
+    CPF_FORMAT_ERROR,
+    CPF_INVALID_ERROR,
+    CPF_LENGTH_ERROR,
+)
 from kami_dataset_validator.validators.email import EmailValidator
 from kami_dataset_validator.validators.phone import PhoneValidator
 
@@ -40,6 +64,7 @@ class CustomerDataValidator:
         cnpj_colname (Optional[str]): Column name for CNPJ.
         phone_colname (Optional[str]): Column name for phone number.
         email_colnames (Optional[str]): List of column names for emails.
+        use_cache (bool): Whether webservice results are persisted across runs.
 
     Methods:
         _check_dataset: Checks if the dataset is valid.
@@ -50,7 +75,6 @@ class CustomerDataValidator:
         _create_cnpj_validation_dataset: Validates CNPJ using either an external API or internal logic.
         _check_cnpj_validate: Checks if CNPJ validation can proceed.
         validate_cnpjs: Validates CNPJ numbers in the dataset.
-        _create_cpf_validation_dataset: Validates CPF numbers in the dataset.
         _check_cpf_validate: Checks if CPF validation can proceed.
         validate_cpfs: Validates CPF numbers in the dataset.
         _create_phone_validation_dataset: Validates phone numbers in the dataset.
@@ -58,7 +82,6 @@ class CustomerDataValidator:
         validate_phones: Validates phone numbers in the dataset.
         _check_email_validate: Checks if email validation can proceed.
         _create_email_validation_dataset: Validates email addresses in the dataset.
-        _validate_emails: Helper method for email validation.
         validate_emails: Validates email addresses in the dataset.
         validate_dataset: Validates the entire dataset and returns a combined DataFrame with validation results.
     """
@@ -75,6 +98,7 @@ class CustomerDataValidator:
         cnpj_colname: Optional[str],
         phone_colname: Optional[str],
         email_colnames: Optional[List[str]],
+        use_cache: bool = False,
     ):
         """Initializes an instance of the CustomerDataValidator class, setting up the
         necessary attributes for subsequent data validation processes.
@@ -90,6 +114,7 @@ class CustomerDataValidator:
             cnpj_colname (Optional[str]): The name of the column in the dataset that contains CNPJ (Brazilian main corporate tax identification) numbers.
             phone_colname (Optional[str]): The name of the column in the dataset that contains phone numbers.
             email_colnames (Optional[List[str]]): A list of column names in the dataset that contain email addresses.
+            use_cache (bool): Whether valid CEP and CNPJ webservice verdicts are read from and stored in the persistent disk cache. Only the 'valid' and 'reason' of each result are stored, never address or company data. Defaults to False.
         """
         self.dataset = dataset
         self.customer_id_colname = customer_id_colname
@@ -101,6 +126,7 @@ class CustomerDataValidator:
         self.cnpj_colname = cnpj_colname
         self.phone_colname = phone_colname
         self.email_colnames = email_colnames
+        self.use_cache = use_cache
 
     def _check_dataset(self):
         """Checks if the dataset is valid, not empty or null, and raises an error if not.
@@ -146,48 +172,383 @@ class CustomerDataValidator:
                 f"The dataset does not contain the required column(s): {', '.join(missing_columns)}"
             )
 
+    @staticmethod
+    def _check_digits_expr(sanitized: pl.Expr, document: str) -> pl.Expr:
+        """Builds the Polars expression that verifies the two modulo-11 check
+        digits of every well-formed document in a column.
+
+        Each document is read as a single integer and its digits are taken
+        with integer division and modulo, so both check digits are computed
+        for the whole batch with column arithmetic only. The arithmetic runs
+        on the materialized integers inside one `map_batches` call, so each
+        digit column is computed once. Documents made of a single repeated
+        digit are rejected, as `validate_docbr` does.
+
+        Args:
+            sanitized (pl.Expr): The sanitized, digit-only documents.
+            document (str): The document type key ('cpf' or 'cnpj').
+
+        Returns:
+            pl.Expr: Whether each document has valid check digits.
+        """
+        first_weights, second_weights = CHECK_DIGIT_WEIGHTS[document]
+        length = len(second_weights) + 1
+
+        def has_valid_check_digits(numbers: pl.Series) -> pl.Series:
+            digits = [
+                numbers // 10 ** (length - 1 - position) % 10
+                for position in range(length)
+            ]
+
+            def check_digit(weights: Tuple[int, ...]) -> pl.Series:
+                total = sum(
+                    digit * weight for digit, weight in zip(digits, weights)
+                )
+                return (11 - total % 11) % 11 % 10
+
+            return (
+                (check_digit(first_weights) == digits[-2])
+                & (check_digit(second_weights) == digits[-1])
+                & (numbers != digits[0] * int('1' * length))
+            )
+
+        return sanitized.str.to_integer(strict=False).map_batches(
+            has_valid_check_digits, return_dtype=pl.Boolean
+        )
+
+    @staticmethod
+    def _document_exprs(
+        column: str,
+        document: str,
+        empty_error: str,
+        format_error: str,
+        length_error: str,
+        invalid_error: str,
+    ) -> Tuple[pl.Expr, pl.Expr]:
+        """Builds the Polars expressions that sanitize a document column and
+        flag its invalid entries.
+
+        Separators are stripped with a single vectorized `str.replace_all`, and
+        the format, length and check digit checks run over the whole column,
+        so no document needs to reach the Python validators.
+
+        Args:
+            column (str): The name of the column holding the raw documents.
+            document (str): The document type key ('cpf' or 'cnpj').
+            empty_error (str): Reason reported for missing or empty values.
+            format_error (str): Reason reported for non-numeric values.
+            length_error (str): Reason reported for values of the wrong length.
+            invalid_error (str): Reason reported for wrong check digits.
+
+        Returns:
+            Tuple[pl.Expr, pl.Expr]: The sanitized document and, for each
+            entry, the rejection reason or null when it is valid.
+        """
+        raw = pl.col(column).cast(pl.Utf8)
+        sanitized = raw.str.replace_all(DOCUMENT_SEPARATORS[document], '')
+        format_error_expr = (
+            pl.when(raw.is_null() | (raw == ''))
+            .then(pl.lit(empty_error))
+            .when(~sanitized.str.contains(r'^[0-9]+$'))
+            .then(pl.lit(format_error))
+            .when(~sanitized.str.contains(f'^{DOCUMENT_PATTERNS[document]}$'))
+            .then(pl.lit(length_error))
+            .when(
+                ~CustomerDataValidator._check_digits_expr(sanitized, document)
+            )
+            .then(pl.lit(invalid_error))
+        )
+        return sanitized, format_error_expr
+
+    def _prefilter_documents(
+        self,
+        documents: pl.Series,
+        document: str,
+        empty_error: str,
+        format_error: str,
+        length_error: str,
+        invalid_error: str,
+    ) -> Tuple[List[Optional[str]], List[Optional[str]]]:
+        """Sanitizes a document column in Polars and flags invalid entries
+        using the expressions from `_document_exprs`.
+
+        Returns:
+            Tuple[List[Optional[str]], List[Optional[str]]]: The sanitized
+            documents and, for each one, the rejection reason or None when it
+            is valid.
+        """
+        sanitized, format_error_expr = self._document_exprs(
+            documents.name,
+            document,
+            empty_error,
+            format_error,
+            length_error,
+            invalid_error,
+        )
+        prefiltered = (
+            documents.to_frame()
+            .lazy()
+            .select(
+                sanitized.alias('sanitized'), format_error_expr.alias('error')
+            )
+            .collect()
+        )
+        return (
+            prefiltered['sanitized'].to_list(),
+            prefiltered['error'].to_list(),
+        )
+
+    @staticmethod
+    def _merge_prefiltered(
+        format_errors: List[Optional[str]], results: List[Dict]
+    ) -> Tuple[List[bool], List[str]]:
+        """Interleaves validator results for the rows that passed a prefilter
+        with the reasons of the rows it rejected.
+        """
+        valids, reasons = [], []
+        pending_results = iter(results)
+
+        for error in format_errors:
+            if error is None:
+                result = next(pending_results)
+                valids.append(result['valid'])
+                reasons.append(result['reason'])
+            else:
+                valids.append(False)
+                reasons.append(error)
+
+        return valids, reasons
+
+    @staticmethod
+    def _validate_unique(
+        values: List, validate_batch: Callable[[List], Dict[str, List]]
+    ) -> Dict[str, List]:
+        """Validates each distinct value once and fans the results back out.
+
+        Args:
+            values (List): The values to validate, possibly repeated.
+            validate_batch (Callable): Validates a list of values and returns
+                result columns holding one entry per value, in order.
+
+        Returns:
+            Dict[str, List]: The result columns, one entry per entry of
+            `values`, in order.
+        """
+        positions = {}
+        indexes = [
+            positions.setdefault(value, len(positions)) for value in values
+        ]
+        columns = validate_batch(list(positions))
+        return {
+            name: [column[index] for index in indexes]
+            for name, column in columns.items()
+        }
+
+    def _validate_column(
+        self,
+        colname: str,
+        alias: str,
+        validate_batch: Callable[[pl.Series], Dict[str, List]],
+        schema: Dict[str, pl.DataType],
+    ) -> pl.DataFrame:
+        """Validates a column in a single lazy Polars plan.
+
+        The customer id and `colname` (renamed to `alias`) are projected, the
+        whole column is handed to `validate_batch` through one `map_batches`
+        call, and the columns it returns are unnested next to them.
+
+        Args:
+            colname (str): The dataset column to validate.
+            alias (str): The name of that column in the result.
+            validate_batch (Callable): Validates a Series and returns the
+                result columns as lists.
+            schema (Dict[str, pl.DataType]): The result columns and dtypes.
+
+        Returns:
+            pl.DataFrame: The id, the validated column and the result columns.
+        """
+
+        def to_struct(batch: pl.Series) -> pl.Series:
+            return pl.DataFrame(
+                validate_batch(batch), schema=schema
+            ).to_struct()
+
+        return (
+            self.dataset.lazy()
+            .select(
+                pl.col(self.customer_id_colname), pl.col(colname).alias(alias)
+            )
+            .with_columns(
+                pl.col(alias)
+                .map_batches(to_struct, return_dtype=pl.Struct(schema))
+                .alias('result')
+            )
+            .unnest('result')
+            .collect()
+        )
+
+    def _prefilter_states(self) -> List[Optional[str]]:
+        """Checks every filled state against `VALID_UFS` in one vectorized
+        expression, so addresses with an invalid UF are rejected without
+        reaching the CEP webservice. Only applied before webservice dispatch;
+        the local CEP format check ignores the state. Returns the rejection
+        reason per row, or None for rows whose state is valid or empty.
+        """
+        state = pl.col(self.state_colname).cast(pl.Utf8)
+        uf = state.str.strip_chars().str.to_uppercase()
+
+        return (
+            self.dataset.select(
+                pl.when(
+                    uf.is_in(sorted(VALID_UFS)) | uf.is_null() | (uf == '')
+                )
+                .then(None)
+                .otherwise(pl.format('Invalid State: {}.', state))
+            )
+            .to_series()
+            .to_list()
+        )
+
     def _create_cep_validation_dataset(
         self,
-        addresses: List[Dict],
+        addresses: List[Address],
+        uf_errors: List[Optional[str]],
         external: bool = False,
         webservice: str = 'opencep',
-        time_step: int = 120,
-        time_delay: float = 0.5,
-    ) -> List[Dict]:
-        start_time = time.time()
-        results = []
-
-        for addr in addresses:
-            address = addr['address']
-            result = {
-                self.customer_id_colname: addr[self.customer_id_colname],
-                'cep': address.cep,
-                'cep_validation': False,
-                'cep_validation_reason': 'Unknown error',
-            }
+        max_rate: float = 10,
+        time_period: float = 3,
+        concurrency: int = 10,
+    ) -> Dict[str, List]:
+        valid_uf_addresses = [
+            address
+            for address, error in zip(addresses, uf_errors)
+            if error is None
+        ]
 
-            if external:
-                cep_api = CepAPI(webservice=webservice)
-                api_result = cep_api.validate_address(address)
-                result['cep_validation'] = api_result['valid']
-                result['cep_validation_reason'] = api_result['reason']
-            else:
-                result['cep_validation'] = address.validate_cep()['valid']
-                result['cep_validation_reason'] = (
-                    'Valid CEP.'
-                    if result['cep_validation']
-                    else 'Invalid CEP format.'
+        if external:
+            results = run_sync(
+                self._create_cep_validation_dataset_async(
+                    addresses=valid_uf_addresses,
+                    webservice=webservice,
+                    max_rate=max_rate,
+                    time_period=time_period,
+                    concurrency=concurrency,
                 )
+            )
 
-            results.append(result)
+        else:
+            results = [
+                {
+                    'valid': valid,
+                    'reason': 'Valid CEP.' if valid else 'Invalid CEP format.',
+                }
+                for valid in (
+                    address.validate_cep()['valid']
+                    for address in valid_uf_addresses
+                )
+            ]
 
-            elapsed_time = time.time() - start_time
-            if elapsed_time >= time_step:
-                time.sleep(time_delay)
-                start_time = time.time()
+        valids, reasons = self._merge_prefiltered(uf_errors, results)
+        return {
+            'cep': self.dataset[self.cep_colname].to_list(),
+            'cep_validation': valids,
+            'cep_validation_reason': reasons,
+        }
 
+    @staticmethod
+    def _cep_key(address: Address) -> Optional[str]:
+        try:
+            return Address._sanitize_cep(address.cep)
+        except CEPFormatError:
+            return address.cep
+
+    def _read_cache(
+        self, name: str, webservice: str, keys: List[str]
+    ) -> Dict[str, Dict]:
+        if not self.use_cache:
+            return {}
+        cache = get_cache(name)
+        results = {}
+        for key in keys:
+            cached = cache.get((webservice, key))
+            if cached is not None:
+                results[key] = cached
         return results
 
+    def _write_cache(
+        self, name: str, webservice: str, results: Dict[str, Dict]
+    ):
+        if not self.use_cache:
+            return
+        cache = get_cache(name)
+        for key, result in results.items():
+            if result['valid']:
+                cache.set(
+                    (webservice, key),
+                    {'valid': result['valid'], 'reason': result['reason']},
+                    expire=CACHE_EXPIRE,
+                )
+
+    async def _create_cep_validation_dataset_async(
+        self,
+        addresses: List[Address],
+        webservice: str = 'opencep',
+        max_rate: float = 10,
+        time_period: float = 3,
+        concurrency: int = 10,
+    ) -> List[Dict]:
+        """Validates the CEPs against the webservice concurrently.
+
+        Each distinct CEP is requested only once; rows sharing a CEP reuse its
+        result, and CEPs validated by a previous run are served from the disk
+        cache. Malformed CEPs are rejected locally, so they neither reach the
+        webservice nor wait on the rate limiter. Requests share a single
+        pooled HTTP client, with at most `concurrency` in flight and no more
+        than `max_rate` started per `time_period` seconds. Results keep the
+        input order.
+        """
+        keys = [self._cep_key(address) for address in addresses]
+        unique_addresses = {}
+        for key, address in zip(keys, addresses):
+            unique_addresses.setdefault(key, address)
+
+        malformed = {}
+        for key, address in unique_addresses.items():
+            try:
+                Address._sanitize_cep(address.cep)
+            except CEPFormatError as e:
+                malformed[key] = {
+                    'address': address.to_dict(),
+                    'valid': False,
+                    'reason': str(e),
+                }
+
+        cache = self._read_cache(
+            'cep',
+            webservice,
+            [key for key in unique_addresses if key not in malformed],
+        )
+        pending = {
+            key: address
+            for key, address in unique_addresses.items()
+            if key not in cache and key not in malformed
+        }
+
+        if pending:
+            cep_api = CepAPI(
+                addresses=list(pending.values()), webservice=webservice
+            )
+            api_results = await cep_api.validate_addresses_async(
+                concurrency=concurrency,
+                rate_limiter=AsyncRateLimiter(max_rate, time_period),
+            )
+            fetched = dict(zip(pending, api_results))
+            self._write_cache('cep', webservice, fetched)
+            cache.update(fetched)
+
+        cache.update(malformed)
+        return [cache[key] for key in keys]
+
     def _check_address_validate(self):
 
         if not self.cep_colname:
@@ -225,7 +586,9 @@ class CustomerDataValidator:
         This method utilizes the CEP column specified during initialization to validate
         the address data. If the address validation flag is enabled and the required columns
         are present in the dataset, it will validate each address and return the results
-        in a new DataFrame.
+        in a new DataFrame. With `external`, rows whose state is not a valid UF
+        are rejected before any webservice request; the local check only looks
+        at the CEP format.
 
         Returns:
             pl.DataFrame: A DataFrame containing the original customer ID and CEP columns,
@@ -239,25 +602,43 @@ class CustomerDataValidator:
 
         try:
             addresses = [
-                {
-                    self.customer_id_colname: row[self.customer_id_colname],
-                    self.cep_colname: row[self.cep_colname],
-                    'address': Address(
-                        cep=row[self.cep_colname],
-                        street=row[self.street_colname],
-                        city=row[self.city_colname],
-                        state=row[self.state_colname],
-                    ),
-                }
-                for row in self.dataset.to_dicts()
+                Address(cep=cep, street=street, city=city, state=state)
+                for cep, street, city, state in zip(
+                    *(
+                        self.dataset[colname].to_list()
+                        for colname in (
+                            self.cep_colname,
+                            self.street_colname,
+                            self.city_colname,
+                            self.state_colname,
+                        )
+                    )
+                )
             ]
 
             cep_validation_result = self._create_cep_validation_dataset(
                 addresses=addresses,
+                uf_errors=(
+                    self._prefilter_states()
+                    if external
+                    else [None] * self.dataset.height
+                ),
                 external=external,
                 webservice=webservice,
             )
-            address_df = pl.DataFrame(cep_validation_result)
+            address_df = pl.DataFrame(
+                {
+                    self.customer_id_colname: self.dataset[
+                        self.customer_id_colname
+                    ],
+                    **cep_validation_result,
+                },
+                schema_overrides={
+                    'cep': pl.Utf8,
+                    'cep_validation': pl.Boolean,
+                    'cep_validation_reason': pl.Utf8,
+                },
+            )
 
         except Exception as e:
             validate_costumer_logger.exception(
@@ -269,32 +650,76 @@ class CustomerDataValidator:
 
     def _create_cnpj_validation_dataset(
         self,
-        cnpjs: List[Dict],
+        cnpjs: pl.Series,
         external: bool = False,
         webservice: str = 'brasilapi',
-        time_step: int = 120,
-        time_delay: float = 0.3,
-    ) -> List[Dict]:
-        result = {'cnpj_validation': False, 'cnpj_validation_reason': ''}
-        start_time = time.time()
-
-        for cnpj_data in cnpjs:
-            cnpj_validator = CNPJValidator(cnpj_data['cnpj'])
-            if external:
-                cnpj_api = CnpjAPI(webservice=webservice)
-                result = cnpj_api.validate_cnpj(cnpj_validator.sanitized_cnpj)
-            else:
-                result = cnpj_validator.validate()
+        max_rate: float = 10,
+        time_period: float = 3,
+        concurrency: int = 10,
+    ) -> Dict[str, List]:
+        sanitized_cnpjs, format_errors = self._prefilter_documents(
+            cnpjs,
+            document='cnpj',
+            empty_error=CNPJ_EMPTY_ERROR,
+            format_error=CNPJ_FORMAT_ERROR,
+            length_error=CNPJ_LENGTH_ERROR,
+            invalid_error=CNPJ_INVALID_ERROR,
+        )
+        valid_cnpjs = [
+            cnpj
+            for cnpj, error in zip(sanitized_cnpjs, format_errors)
+            if error is None
+        ]
+
+        if external:
+            results = run_sync(
+                self._create_cnpj_validation_dataset_async(
+                    cnpjs=valid_cnpjs,
+                    webservice=webservice,
+                    max_rate=max_rate,
+                    time_period=time_period,
+                    concurrency=concurrency,
+                )
+            )
+        else:
+            results = [{'valid': True, 'reason': 'Valid CNPJ.'}] * len(
+                valid_cnpjs
+            )
 
-            cnpj_data['cnpj_validation'] = result['valid']
-            cnpj_data['cnpj_validation_reason'] = result['reason']
-            elapsed_time = time.time() - start_time
+        valids, reasons = self._merge_prefiltered(format_errors, results)
+        return {'cnpj_validation': valids, 'cnpj_validation_reason': reasons}
 
-            if elapsed_time >= time_step:
-                time.sleep(time_delay)
-                start_time = time.time()
+    async def _create_cnpj_validation_dataset_async(
+        self,
+        cnpjs: List[str],
+        webservice: str = 'brasilapi',
+        max_rate: float = 10,
+        time_period: float = 3,
+        concurrency: int = 10,
+    ) -> List[Dict]:
+        """Validates the CNPJs against the webservice concurrently.
+
+        Uses the same deduplication and rate limiting as
+        `_create_cep_validation_dataset_async`: each distinct CNPJ is requested
+        once over a shared pooled HTTP client, unless cached by a previous run,
+        with at most `concurrency` requests in flight and no more than
+        `max_rate` started per `time_period` seconds. Returns one result per
+        input CNPJ, in order.
+        """
+        unique_cnpjs = list(dict.fromkeys(cnpjs))
+        cache = self._read_cache('cnpj', webservice, unique_cnpjs)
+        pending = [cnpj for cnpj in unique_cnpjs if cnpj not in cache]
+
+        cnpj_api = CnpjAPI(cnpj_list=pending, webservice=webservice)
+        api_results = await cnpj_api.validate_cnpjs_async(
+            concurrency=concurrency,
+            rate_limiter=AsyncRateLimiter(max_rate, time_period),
+        )
 
-        return cnpjs
+        fetched = dict(zip(pending, api_results))
+        self._write_cache('cnpj', webservice, fetched)
+        cache.update(fetched)
+        return [cache[cnpj] for cnpj in cnpjs]
 
     def _check_cnpj_validate(self):
         if not self.cnpj_colname:
@@ -325,21 +750,17 @@ class CustomerDataValidator:
         cnpj_df = pl.DataFrame()
 
         try:
-
-            cnpjs = [
-                {
-                    self.customer_id_colname: row[self.customer_id_colname],
-                    'cnpj': row[self.cnpj_colname],
-                }
-                for row in self.dataset.to_dicts()
-            ]
-
-            cnpj_validation_result = self._create_cnpj_validation_dataset(
-                cnpjs=cnpjs,
-                external=external,
-                webservice=webservice,
+            cnpj_df = self._validate_column(
+                self.cnpj_colname,
+                'cnpj',
+                lambda cnpjs: self._create_cnpj_validation_dataset(
+                    cnpjs=cnpjs, external=external, webservice=webservice
+                ),
+                schema={
+                    'cnpj_validation': pl.Boolean,
+                    'cnpj_validation_reason': pl.Utf8,
+                },
             )
-            cnpj_df = pl.DataFrame(cnpj_validation_result)
 
         except Exception as e:
             validate_costumer_logger.exception(f'Error validating CNPJ: {e}')
@@ -347,18 +768,6 @@ class CustomerDataValidator:
 
         return cnpj_df
 
-    def _create_cpf_validation_dataset(self, cpfs: List[Dict]):
-        cpf_validation_results = CPFValidator.validate_cpfs(
-            [cpf_data['cpf'] for cpf_data in cpfs]
-        )
-
-        for i, cpf_data in enumerate(cpfs):
-            cpf_validation_result = cpf_validation_results[i]
-            cpf_data['cpf_validation'] = cpf_validation_result['valid']
-            cpf_data['cpf_validation_reason'] = cpf_validation_result['reason']
-
-        return cpfs
-
     def _check_cpf_validate(self):
 
         if not self.cpf_colname:
@@ -385,18 +794,28 @@ class CustomerDataValidator:
         cpf_df = pl.DataFrame()
 
         try:
-            cpfs = [
-                {
-                    self.customer_id_colname: row[self.customer_id_colname],
-                    'cpf': row[self.cpf_colname],
-                }
-                for row in self.dataset.to_dicts()
-            ]
-
-            cpf_validation_result = self._create_cpf_validation_dataset(
-                cpfs=cpfs
+            _, format_error = self._document_exprs(
+                'cpf',
+                document='cpf',
+                empty_error=CPF_EMPTY_ERROR,
+                format_error=CPF_FORMAT_ERROR,
+                length_error=CPF_LENGTH_ERROR,
+                invalid_error=CPF_INVALID_ERROR,
+            )
+            cpf_df = (
+                self.dataset.lazy()
+                .select(
+                    pl.col(self.customer_id_colname),
+                    pl.col(self.cpf_colname).alias('cpf'),
+                )
+                .with_columns(
+                    format_error.is_null().alias('cpf_validation'),
+                    format_error.fill_null(pl.lit('Valid CPF.')).alias(
+                        'cpf_validation_reason'
+                    ),
+                )
+                .collect()
             )
-            cpf_df = pl.DataFrame(cpf_validation_result)
 
         except Exception as e:
             validate_costumer_logger.exception(f'Error validating CPF: {e}')
@@ -405,23 +824,20 @@ class CustomerDataValidator:
         return cpf_df
 
     def _create_phone_validation_dataset(
-        self, phones: List[Dict]
-    ) -> List[Dict]:
-        phone_validation_results = PhoneValidator.validate_phone_numbers(
-            [phone_data['phone'] for phone_data in phones]
+        self, phones: pl.Series, default_region: Optional[str] = None
+    ) -> Dict[str, List]:
+        phone_validation_columns = self._validate_unique(
+            phones.to_list(),
+            lambda numbers: PhoneValidator.validate_phone_numbers_columns(
+                numbers, default_region
+            ),
         )
 
-        for i, phone_data in enumerate(phones):
-            phone_validation_result = phone_validation_results[i]
-            phone_data['phone_validation'] = phone_validation_result['valid']
-            phone_data['phone_validation_reason'] = phone_validation_result[
-                'reason'
-            ]
-            phone_data['possible_mobile'] = phone_validation_result.get(
-                'possible_mobile', False
-            )
-
-        return phones
+        return {
+            'phone_validation': phone_validation_columns['valid'],
+            'phone_validation_reason': phone_validation_columns['reason'],
+            'possible_mobile': phone_validation_columns['possible_mobile'],
+        }
 
     def _check_phone_validate(self):
 
@@ -432,13 +848,19 @@ class CustomerDataValidator:
         required_columns = [self.customer_id_colname, self.phone_colname]
         self._check_column_existence(required_columns)
 
-    def validate_phones(self, external: bool = False) -> pl.DataFrame:
+    def validate_phones(
+        self, external: bool = False, default_region: Optional[str] = None
+    ) -> pl.DataFrame:
         """Validates phone numbers in the dataset.
 
         Utilizing the phone column designated at initialization, this method validates
         the phone numbers. If phone validation is activated and the necessary columns
         exist, it will validate each phone number and assemble the results in a new DataFrame.
 
+        Args:
+            default_region (Optional[str]): Region, such as 'BR', assumed for
+                numbers written without a '+' country code.
+
         Returns:
             pl.DataFrame: A DataFrame containing the original customer ID and phone columns,
             along with two new columns: 'phone_validation' indicating if the phone number is valid,
@@ -449,26 +871,17 @@ class CustomerDataValidator:
         phone_df = pl.DataFrame()
 
         try:
-            phones = [
-                {
-                    self.customer_id_colname: row[self.customer_id_colname],
-                    'phone': row[self.phone_colname],
-                }
-                for row in self.dataset.to_dicts()
-            ]
-
-            phone_validation_result = self._create_phone_validation_dataset(
-                phones=phones
-            )
-            phone_df = pl.DataFrame(phone_validation_result)
-            phone_df = phone_df.select(
-                [
-                    self.customer_id_colname,
-                    'phone',
-                    'phone_validation',
-                    'phone_validation_reason',
-                    'possible_mobile',
-                ]
+            phone_df = self._validate_column(
+                self.phone_colname,
+                'phone',
+                lambda phones: self._create_phone_validation_dataset(
+                    phones, default_region
+                ),
+                schema={
+                    'phone_validation': pl.Boolean,
+                    'phone_validation_reason': pl.Utf8,
+                    'possible_mobile': pl.Boolean,
+                },
             )
         except Exception as e:
             validate_costumer_logger.exception(f'Error validating phone: {e}')
@@ -487,50 +900,37 @@ class CustomerDataValidator:
         self._check_column_existence(required_columns)
 
     def _create_email_validation_dataset(
-        self, emails: List[Dict], email_colname: str = 'email'
-    ) -> List[Dict]:
-        email_validation_results = EmailValidator.validate_emails(
-            [email_data['email'] for email_data in emails]
-        )
-
-        for i, email_data in enumerate(emails):
-            email_validation_result = email_validation_results[i]
-            email_data[
-                f'{email_colname}_validation'
-            ] = email_validation_result['valid']
-            email_data[
-                f'{email_colname}_validation_reason'
-            ] = email_validation_result['reason']
-            email_data[
-                f'{email_colname}_deliverability'
-            ] = email_validation_result['deliverability']
-
-        return emails
-
-    def _validate_emails(self, email_colname: str = 'email') -> pl.DataFrame:
-        self._check_dataset()
-        self._check_email_validate()
-        email_df = pl.DataFrame()
-
-        try:
-            emails = [
-                {
-                    self.customer_id_colname: row[self.customer_id_colname],
-                    'email': row[email_colname],
-                }
-                for row in self.dataset.to_dicts()
-            ]
+        self, columns: Dict[str, List[str]]
+    ) -> Dict[str, Dict[str, List]]:
+        """Validates the emails of every column in a single batch.
 
-            email_validation_result = self._create_email_validation_dataset(
-                emails=emails, email_colname=email_colname
-            )
-            email_df = pl.DataFrame(email_validation_result)
-
-        except Exception as e:
-            validate_costumer_logger.exception(f'Error validating email: {e}')
-            raise CustomerDataValidatorError(f'E-mail validation failed: {e}')
+        Each distinct address is checked once, even when it repeats within a
+        column or across columns, and the results are then split back into
+        the validation columns of each source column.
+        """
+        unique_emails = list(
+            dict.fromkeys(chain.from_iterable(columns.values()))
+        )
+        validated = dict(
+            zip(unique_emails, EmailValidator.validate_emails(unique_emails))
+        )
+        validation_dataset = {}
+
+        for email_colname, emails in columns.items():
+            results = [validated[email] for email in emails]
+            validation_dataset[email_colname] = {
+                f'{email_colname}_validation': [
+                    result['valid'] for result in results
+                ],
+                f'{email_colname}_validation_reason': [
+                    result['reason'] for result in results
+                ],
+                f'{email_colname}_deliverability': [
+                    result['deliverability'] for result in results
+                ],
+            }
 
-        return email_df
+        return validation_dataset
 
     def validate_emails(self, external: bool = False) -> pl.DataFrame:
         """Validates email addresses in the dataset.
@@ -547,16 +947,29 @@ class CustomerDataValidator:
             email column passed during initialization.
         """
 
-        email_df_list = []
+        self._check_dataset()
+        self._check_email_validate()
         emails_df = pl.DataFrame()
 
         try:
+            validation_dataset = self._create_email_validation_dataset(
+                {
+                    email_colname: self.dataset[email_colname].to_list()
+                    for email_colname in self.email_colnames
+                }
+            )
+            email_columns = {
+                self.customer_id_colname: self.dataset[
+                    self.customer_id_colname
+                ]
+            }
             for email_colname in self.email_colnames:
-                email_df_list.append(self._validate_emails(email_colname))
-            emails_df = pl.concat(email_df_list, how='horizontal')
+                email_columns[email_colname] = self.dataset[email_colname]
+                email_columns.update(validation_dataset[email_colname])
+            emails_df = pl.DataFrame(email_columns)
         except Exception as e:
             validate_costumer_logger.exception(f'Error validating email: {e}')
-            raise
+            raise CustomerDataValidatorError(f'E-mail validation failed: {e}')
 
         return emails_df
 
@@ -604,43 +1017,47 @@ class CustomerDataValidator:
             CustomerDataValidatorError: If the 'external' key is True and 'webservice' is not provided,
             or if an invalid webservice is provided.
         """
-        combined_df = self.dataset.select([self.customer_id_colname])
         self._check_fields(fields=fields)
+        validation_dfs = [self.dataset.select([self.customer_id_colname])]
+        field_validators = {
+            'cep': lambda field: self.validate_address_from_cep(
+                external=field.get('external'),
+                webservice=field.get('webservice'),
+            ),
+            'cpf': lambda field: self.validate_cpfs(),
+            'cnpj': lambda field: self.validate_cnpjs(
+                external=field.get('external'),
+                webservice=field.get('webservice'),
+            ),
+            'phone': lambda field: self.validate_phones(),
+            'email': lambda field: self.validate_emails(),
+        }
+        selected_fields = [
+            field
+            for field in fields
+            if field['name'].lower() in field_validators
+        ]
 
         try:
-            for field in fields:
-                field_name = field['name'].lower()
-                if 'cep' == field_name:
-                    cep_df = self.validate_address_from_cep(
-                        external=field.get('external'),
-                        webservice=field.get('webservice'),
-                    )
-                    combined_df = combined_df.join(
-                        cep_df, on=self.customer_id_colname, how='outer'
-                    )
-                if 'cpf' == field_name:
-                    cpf_df = self.validate_cpfs()
-                    combined_df = combined_df.join(
-                        cpf_df, on=self.customer_id_colname, how='outer'
-                    )
-                if 'cnpj' == field_name:
-                    cnpj_df = self.validate_cnpjs(
-                        external=field.get('external'),
-                        webservice=field.get('webservice'),
-                    )
-                    combined_df = combined_df.join(
-                        cnpj_df, on=self.customer_id_colname, how='outer'
-                    )
-                if 'phone' == field_name:
-                    phone_df = self.validate_phones()
-                    combined_df = combined_df.join(
-                        phone_df, on=self.customer_id_colname, how='outer'
-                    )
-                if 'email' == field_name:
-                    email_df = self.validate_emails()
-                    combined_df = combined_df.join(
-                        email_df, on=self.customer_id_colname, how='outer'
+            with ThreadPoolExecutor(
+                max_workers=max(len(selected_fields), 1)
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        field_validators[field['name'].lower()], field
                     )
+                    for field in selected_fields
+                ]
+                validation_dfs.extend(future.result() for future in futures)
+
+            combined_df = pl.concat(
+                [validation_dfs[0]]
+                + [
+                    validation_df.drop(self.customer_id_colname)
+                    for validation_df in validation_dfs[1:]
+                ],
+                how='horizontal',
+            )
         except CustomerDataValidatorError as e:
             validate_costumer_logger.error(f'Validation error: {e}')
             raise
@@ -1,16 +1,62 @@
-import json
+import heapq
 import logging
-from difflib import SequenceMatcher
-from typing import Dict, List, Optional, Union
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Union
 
 import httpx
+import orjson
 from kami_logging import benchmark_with, logging_with
 from pyUFbr.baseuf import ufbr
-
+from rapidfuzz import fuzz, process
+
+from kami_dataset_validator.cache import LRUCache
+from kami_dataset_validator.concurrency import (
+    AsyncRateLimiter,
+    create_async_client,
+    create_client,
+    gather_limited,
+    get_with_backoff,
+)
 from kami_dataset_validator.constants import KEY_TRANSLATIONS
 
 cepapi_logger = logging.getLogger('Address Validator')
 
+SIMILARITY_ATTRIBUTES = (
+    'cep',
+    'street',
+    'complement',
+    'district',
+    'city',
+    'state',
+    'ibge',
+    'gia',
+    'ddd',
+    'siafi',
+)
+
+
+@lru_cache(maxsize=None)
+def _valid_ufs(source: Any) -> FrozenSet[str]:
+    """UFs listed by `source` (the pyUFbr database), built once."""
+    return frozenset(source.list_uf)
+
+
+@lru_cache(maxsize=None)
+def _cities_in_uf(source: Any, uf: str) -> FrozenSet[str]:
+    """Cities of `uf` listed by `source`, built once per UF."""
+    return frozenset(source.list_cidades(uf))
+
+
+@lru_cache(maxsize=None)
+def _ufs_by_city(source: Any) -> Dict[str, FrozenSet[str]]:
+    """Maps every city listed by `source` to the UFs that contain it."""
+    ufs_by_city = {}
+    for uf in _valid_ufs(source):
+        for city in _cities_in_uf(source, uf):
+            ufs_by_city.setdefault(city, set()).add(uf)
+    return {city: frozenset(ufs) for city, ufs in ufs_by_city.items()}
+
 
 class CEPFormatError(Exception):
     """Raised when find a invalid CEP format."""
@@ -38,30 +84,25 @@ class APIConfigError(Exception):
     pass
 
 
+@dataclass(slots=True, eq=False)
 class Address:
-    def __init__(
-        self,
-        cep: Optional[str] = None,
-        street: Optional[str] = None,
-        complement: Optional[str] = None,
-        district: Optional[str] = None,
-        city: Optional[str] = None,
-        state: Optional[str] = None,
-        ibge: Optional[str] = None,
-        gia: Optional[str] = None,
-        ddd: Optional[str] = None,
-        siafi: Optional[str] = None,
-    ):
-        self.cep = cep
-        self.street = street
-        self.complement = complement
-        self.district = district
-        self.city = city
-        self.state = state
-        self.ibge = ibge
-        self.gia = gia
-        self.ddd = ddd
-        self.siafi = siafi
+    """
+    A Brazilian address, with English field names.
+
+    Instances are slotted, as one is built per dataset row, and keep
+    identity equality so they stay hashable.
+    """
+
+    cep: Optional[str] = None
+    street: Optional[str] = None
+    complement: Optional[str] = None
+    district: Optional[str] = None
+    city: Optional[str] = None
+    state: Optional[str] = None
+    ibge: Optional[str] = None
+    gia: Optional[str] = None
+    ddd: Optional[str] = None
+    siafi: Optional[str] = None
 
     @classmethod
     def _sanitize_cep(cls, cep: str) -> str:
@@ -77,6 +118,11 @@ class Address:
         if not cep:
             raise CEPFormatError('CEP cannot be empty.')
 
+        if not isinstance(cep, str):
+            raise CEPFormatError(
+                f'Invalid CEP: {cep}. A CEP must contain only numbers.'
+            )
+
         sanitized_cep = cep.replace('-', '').replace('.', '').replace(' ', '')
 
         if len(sanitized_cep) != 8:
@@ -84,7 +130,7 @@ class Address:
                 f'Invalid CEP: {cep}. A valid CEP must have 8 numbers.'
             )
 
-        if not sanitized_cep.isdigit():
+        if not (sanitized_cep.isascii() and sanitized_cep.isdigit()):
             raise CEPFormatError(
                 f'Invalid CEP: {cep}. A CEP must contain only numbers.'
             )
@@ -144,12 +190,7 @@ class Address:
         Returns:
             bool: True if the CEP is valid, False otherwise.
         """
-        try:
-            self.cep = Address._sanitize_cep(self.cep)
-        except CEPFormatError as e:
-            raise e
-        except Exception as e:
-            raise e
+        self.cep = Address._sanitize_cep(self.cep)
         return True
 
     def _validate_uf(self) -> bool:
@@ -162,12 +203,10 @@ class Address:
         Returns:
             bool: True if valid, False otherwise.
         """
-        valid_ufs = ufbr.list_uf
-
         if not self.state:
             raise InvalidAddressInputError('State cannot be empty.')
 
-        if self.state not in valid_ufs:
+        if self.state not in _valid_ufs(ufbr):
             raise InvalidAddressInputError(f'Invalid State: {self.state}.')
 
         return True
@@ -192,21 +231,14 @@ class Address:
             raise InvalidAddressInputError('Locality cannot be empty.')
 
         self._validate_uf()
-        cities_in_uf = ufbr.list_cidades(self.state)
 
-        if self.city not in cities_in_uf:
+        if self.city not in _cities_in_uf(ufbr, self.state):
             raise InvalidAddressInputError(
                 f'Invalid City: {self.city} for State: {self.state}.'
             )
 
         else:
-            valid_ufs = ufbr.list_uf
-            valid = any(
-                self.city in ufbr.list_cidades(current_uf)
-                for current_uf in valid_ufs
-            )
-
-            if not valid:
+            if self.city not in _ufs_by_city(ufbr):
                 raise InvalidAddressInputError(
                     f'Invalid locality: {self.city}. Not found in any UF.'
                 )
@@ -235,8 +267,6 @@ class Address:
                 result['reason'] = 'CEP not provided.'
         except CEPFormatError as e:
             result['reason'] = str(e)
-        except Exception as e:
-            result['reason'] = f'An unexpected error occurred: {str(e)}'
 
         return result
 
@@ -247,7 +277,7 @@ class Address:
         Returns:
             Dict[str, str]: Dictionary representation of the address.
         """
-        address_dict = {
+        return {
             'cep': self.cep,
             'logradouro': self.street,
             'complemento': self.complement,
@@ -260,9 +290,6 @@ class Address:
             'siafi': self.siafi,
         }
 
-        reverse_translation = {v: k for k, v in KEY_TRANSLATIONS.items()}
-        return self._translate_keys(address_dict, reverse_translation)
-
 
 CEP_WEBSERVICES = {
     'viacep': {
@@ -305,46 +332,97 @@ class CepAPI:
         self.results = []
         self.webservice = webservice
         self.base_url = CEP_WEBSERVICES[webservice]['BASE_URL']
+        self.responses = LRUCache()
+        self._client: Optional[httpx.Client] = None
+
+    @property
+    def client(self) -> httpx.Client:
+        """HTTP client shared by the synchronous requests of this instance."""
+        if self._client is None:
+            self._client = create_client()
+        return self._client
+
+    def close(self) -> None:
+        """Close the shared HTTP client, if it was opened."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def __enter__(self) -> 'CepAPI':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def _fetch_by_cep(self, cep: str) -> Union[Dict[str, str], None]:
-        with httpx.Client() as client:
-            url = self.base_url.format(cep)
-            cepapi_logger.info(
-                f'Fetching data from {str.upper(self.webservice)} for CEP: {cep}'
-            )
-            cepapi_logger.info(f'URL: {url}')
-            try:
-                response = client.get(url)
-                if response.status_code != 200:
-                    raise APIRequestError(
-                        f'Failed to fetch data from {url} of {str.upper(self.webservice)}.'
-                    )
-                response.raise_for_status()
-                return response.json()
-            except (httpx.RequestError, httpx.HTTPStatusError) as exc:
+        cached = self.responses.get(cep)
+        if cached is not None:
+            return cached
+
+        url = self.base_url.format(cep)
+        cepapi_logger.info(
+            f'Fetching data from {str.upper(self.webservice)} for CEP: {cep}'
+        )
+        cepapi_logger.info(f'URL: {url}')
+        try:
+            response = self.client.get(url)
+            if response.status_code != 200:
                 raise APIRequestError(
-                    f"An error occurred while requesting '{url}' from {str.upper(self.webservice)}: {exc}"
-                ) from exc
+                    f'Failed to fetch data from {url} of {str.upper(self.webservice)}.'
+                )
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            self.responses.set(cep, data)
+            return data
+        except (httpx.RequestError, httpx.HTTPStatusError) as exc:
+            raise APIRequestError(
+                f"An error occurred while requesting '{url}' from {str.upper(self.webservice)}: {exc}"
+            ) from exc
+
+    async def _fetch_by_cep_async(
+        self, client: httpx.AsyncClient, cep: str
+    ) -> Union[Dict[str, str], None]:
+        cached = self.responses.get(cep)
+        if cached is not None:
+            return cached
+
+        url = self.base_url.format(cep)
+        cepapi_logger.info(
+            f'Fetching data from {str.upper(self.webservice)} for CEP: {cep}'
+        )
+        cepapi_logger.info(f'URL: {url}')
+        try:
+            response = await get_with_backoff(client, url)
+            if response.status_code != 200:
+                raise APIRequestError(
+                    f'Failed to fetch data from {url} of {str.upper(self.webservice)}.'
+                )
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            self.responses.set(cep, data)
+            return data
+        except (httpx.RequestError, httpx.HTTPStatusError) as exc:
+            raise APIRequestError(
+                f"An error occurred while requesting '{url}' from {str.upper(self.webservice)}: {exc}"
+            ) from exc
+
+    def _set_cep_result(self, result: Dict, data: Dict) -> Dict:
+        if data and data.get('cep'):
+            result['valid'] = True
+            result['reason'] = 'Valid CEP.'
+        else:
+            result[
+                'reason'
+            ] = f'CEP not found in {str.upper(self.webservice)}.'
+        return result
 
     def _compute_similarity(self, addr1: Address, addr2: Address) -> float:
-        attributes = [
-            'cep',
-            'street',
-            'complement',
-            'district',
-            'city',
-            'state',
-            'ibge',
-            'gia',
-            'ddd',
-            'siafi',
-        ]
         ratios = []
 
-        for attr in attributes:
+        for attr in SIMILARITY_ATTRIBUTES:
             attr1, attr2 = getattr(addr1, attr, ''), getattr(addr2, attr, '')
             if attr1 and attr2:
-                similarity = SequenceMatcher(None, attr1, attr2).ratio()
+                similarity = fuzz.ratio(attr1, attr2) / 100
                 ratios.append(similarity)
 
         if not ratios:
@@ -352,36 +430,77 @@ class CepAPI:
 
         return round(sum(ratios) / len(ratios), 3)
 
-    @benchmark_with(cepapi_logger)
-    @logging_with(cepapi_logger)
     def filter_addresses_by_similarity(
-        self, target_address: Address, search_addresses: List[Address]
+        self,
+        target_address: Address,
+        search_addresses: List[Address],
+        limit: Optional[int] = None,
     ) -> List[Dict]:
-        similarities = []
+        """
+        Rank the addresses by their similarity to the target address.
 
-        for address in search_addresses:
-            similarity_ratio = self._compute_similarity(
-                target_address, address
-            )
-            if similarity_ratio > 0:
-                similarities.append(
-                    {
-                        'similarity_ratio': similarity_ratio,
-                        'address': address.to_dict(),
-                    }
-                )
+        Scores match `_compute_similarity`, but each attribute is compared
+        against every candidate in a single `rapidfuzz.process.extract` call.
 
-        return sorted(
-            similarities, key=lambda x: x['similarity_ratio'], reverse=True
-        )
+        Args:
+            target_address (Address): The address to compare against.
+            search_addresses (List[Address]): The candidate addresses.
+            limit (Optional[int]): Keep only the `limit` most similar
+                addresses. Defaults to all addresses with a positive score.
+
+        Returns:
+            List[Dict]: The similarity ratio and address of each match, most
+            similar first.
+        """
+        totals = [0.0] * len(search_addresses)
+        counts = [0] * len(search_addresses)
+
+        for attr in SIMILARITY_ATTRIBUTES:
+            target_value = getattr(target_address, attr, '')
+            if not target_value:
+                continue
+            matches = process.extract(
+                target_value,
+                [
+                    getattr(address, attr, '') or None
+                    for address in search_addresses
+                ],
+                scorer=fuzz.ratio,
+                limit=None,
+            )
+            for _, score, index in matches:
+                totals[index] += score / 100
+                counts[index] += 1
+
+        ratios = [
+            (ratio, index)
+            for index, ratio in enumerate(
+                round(total / count, 3) if count else 0
+                for total, count in zip(totals, counts)
+            )
+            if ratio > 0
+        ]
+        if limit is None:
+            ranked = sorted(ratios, key=lambda x: x[0], reverse=True)
+        else:
+            ranked = heapq.nlargest(limit, ratios, key=lambda x: x[0])
+
+        return [
+            {
+                'similarity_ratio': ratio,
+                'address': search_addresses[index].to_dict(),
+            }
+            for ratio, index in ranked
+        ]
 
     def _suports_address(self) -> bool:
         return CEP_WEBSERVICES[self.webservice]['supports_address']
 
-    @benchmark_with(cepapi_logger)
-    @logging_with(cepapi_logger)
     def validate_address(
-        self, address: Address, suggest_cep: bool = False
+        self,
+        address: Address,
+        suggest_cep: bool = False,
+        local_only: bool = False,
     ) -> Dict:
         result = {
             'address': address.to_dict(),
@@ -389,12 +508,16 @@ class CepAPI:
             'reason': '',
         }
 
+        if local_only:
+            local_result = address.validate_cep()
+            result['valid'] = local_result['valid']
+            result['reason'] = local_result['reason']
+            return result
+
         try:
             if address.sanitize_cep():
                 data = self._fetch_by_cep(address.cep)
-                if data['cep']:
-                    result['valid'] = True
-                    result['reason'] = 'Valid CEP.'
+                self._set_cep_result(result, data)
             elif (
                 address.street
                 and address.city
@@ -426,7 +549,7 @@ class CepAPI:
                             if suggest_cep:
                                 result[
                                     'reason'
-                                ] += f' Addresses: {json.dumps(data)}'
+                                ] += f' Addresses: {orjson.dumps(data).decode()}'
                         else:
                             result[
                                 'reason'
@@ -448,8 +571,74 @@ class CepAPI:
 
     @benchmark_with(cepapi_logger)
     @logging_with(cepapi_logger)
-    def validate_addresses(self, suggest_cep: bool = False) -> None:
+    def validate_addresses(
+        self, suggest_cep: bool = False, local_only: bool = False
+    ) -> None:
         self.results = [
-            self.validate_address(address, suggest_cep)
+            self.validate_address(address, suggest_cep, local_only)
             for address in self.addresses
         ]
+
+    async def validate_address_async(
+        self, client: httpx.AsyncClient, address: Address
+    ) -> Dict:
+        """
+        Validate the CEP of an address against the webservice without blocking.
+
+        Only the CEP lookup is performed asynchronously; the search by street,
+        city and state remains available through `validate_address`.
+
+        Args:
+            client (httpx.AsyncClient): Shared client used for the request.
+            address (Address): Address to validate.
+
+        Returns:
+            Dict: A dictionary containing the validation result and reason.
+        """
+        result = {
+            'address': address.to_dict(),
+            'valid': False,
+            'reason': '',
+        }
+
+        try:
+            address.sanitize_cep()
+            data = await self._fetch_by_cep_async(client, address.cep)
+            self._set_cep_result(result, data)
+        except (CEPFormatError, APIRequestError) as e:
+            result['reason'] = str(e)
+
+        return result
+
+    async def validate_addresses_async(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        concurrency: int = 10,
+        rate_limiter: Optional[AsyncRateLimiter] = None,
+    ) -> List[Dict]:
+        """
+        Validate the CEPs of `self.addresses` concurrently.
+
+        Args:
+            client (Optional[httpx.AsyncClient]): Shared client used for the
+                requests. A pooled client is created when omitted.
+            concurrency (int): Maximum number of requests in flight.
+            rate_limiter (Optional[AsyncRateLimiter]): Paces the requests.
+
+        Returns:
+            List[Dict]: One result per address, in order. Also stored in
+            `self.results`.
+        """
+        if client is None:
+            async with create_async_client(concurrency) as client:
+                return await self.validate_addresses_async(
+                    client, concurrency, rate_limiter
+                )
+
+        self.results = await gather_limited(
+            lambda address: self.validate_address_async(client, address),
+            self.addresses,
+            concurrency,
+            rate_limiter,
+        )
+        return self.results
@@ -1,11 +1,47 @@
 import logging
-from typing import Dict, List
+from operator import mul
+from typing import Dict, List, Optional, Tuple
 
 import httpx
+import orjson
 from kami_logging import benchmark_with, logging_with
-from validate_docbr import CNPJ
+
+from kami_dataset_validator.cache import LRUCache
+from kami_dataset_validator.concurrency import (
+    AsyncRateLimiter,
+    create_async_client,
+    create_client,
+    gather_limited,
+    get_with_backoff,
+)
+from kami_dataset_validator.constants import CHECK_DIGIT_WEIGHTS
 
 cnpjapi_logger = logging.getLogger('CNPJ Validator')
+CNPJ_EMPTY_ERROR = 'Empty CNPJ.'
+CNPJ_FORMAT_ERROR = 'Invalid CNPJ format. Ensure it contains only numbers.'
+CNPJ_LENGTH_ERROR = 'Invalid CNPJ length. Ensure it has 14 digits.'
+CNPJ_INVALID_ERROR = 'Invalid CNPJ.'
+CNPJ_FIRST_WEIGHTS, CNPJ_SECOND_WEIGHTS = CHECK_DIGIT_WEIGHTS['cnpj']
+
+
+def _check_digit(digits: List[int], weights: Tuple[int, ...]) -> int:
+    remainder = sum(map(mul, digits, weights)) % 11
+    return 0 if remainder < 2 else 11 - remainder
+
+
+def _has_valid_check_digits(cnpj: str) -> bool:
+    """Checks the modulo-11 check digits of a sanitized 14-digit CNPJ.
+
+    Matches `validate_docbr.CNPJ().validate` for numeric CNPJs, including
+    the rejection of CNPJs made of a single repeated digit.
+    """
+    if cnpj == cnpj[0] * 14:
+        return False
+    digits = [ord(char) - 48 for char in cnpj]
+    return (
+        _check_digit(digits, CNPJ_FIRST_WEIGHTS) == digits[12]
+        and _check_digit(digits, CNPJ_SECOND_WEIGHTS) == digits[13]
+    )
 
 
 class CNPJValueError(Exception):
@@ -32,6 +68,12 @@ class CNPJValidator:
         self.sanitized_cnpj = self._sanitize_cnpj()
 
     def _sanitize_cnpj(self) -> str:
+        if not self.cnpj:
+            raise CNPJValueError(CNPJ_EMPTY_ERROR)
+
+        if not isinstance(self.cnpj, str):
+            raise CNPJValueError(CNPJ_FORMAT_ERROR)
+
         sanitized_cnpj = (
             self.cnpj.replace('.', '')
             .replace('/', '')
@@ -39,21 +81,21 @@ class CNPJValidator:
             .replace(',', '')
         )
 
-        if not sanitized_cnpj.isdigit():
-            raise CNPJValueError(
-                'Invalid CNPJ format. Ensure it contains only numbers.'
-            )
+        if not (sanitized_cnpj.isascii() and sanitized_cnpj.isdigit()):
+            raise CNPJValueError(CNPJ_FORMAT_ERROR)
 
         if len(sanitized_cnpj) != 14:
-            raise CNPJValueError(
-                'Invalid CNPJ length. Ensure it has 14 digits.'
-            )
+            raise CNPJValueError(CNPJ_LENGTH_ERROR)
 
         return sanitized_cnpj
 
+    def is_valid(self) -> bool:
+        """Checks the CNPJ check digits without building a result."""
+        return _has_valid_check_digits(self.sanitized_cnpj)
+
     def validate(self) -> Dict[str, any]:
         """
-        Validate the CNPJ using the validate_docbr library. without using external APIs.
+        Validate the CNPJ check digits without using external APIs.
 
         Returns:
             Dict[str, any]: A dictionary containing the validation result.
@@ -61,22 +103,11 @@ class CNPJValidator:
         result = {
             '' 'cnpj': self.cnpj,
             'valid': False,
-            'reason': 'Invalid CNPJ.',
+            'reason': CNPJ_INVALID_ERROR,
         }
-        cnpj_validator = CNPJ()
-        try:
-            if self.cnpj:
-                if self._sanitize_cnpj() and cnpj_validator.validate(
-                    self.sanitized_cnpj
-                ):
-                    result['valid'] = True
-                    result['reason'] = 'Valid CNPJ.'
-            else:
-                result['reason'] = 'Empty CNPJ.'
-        except CNPJValueError as e:
-            result['reason'] = str(e)
-        except Exception as e:
-            result['reason'] = f'An unexpected error occurred: {str(e)}'
+        if self.is_valid():
+            result['valid'] = True
+            result['reason'] = 'Valid CNPJ.'
 
         return result
 
@@ -116,27 +147,89 @@ class CnpjAPI:
         self.results = []
         self.webservice = webservice
         self.base_url = CNPJ_WEBSERVICES[webservice]['BASE_URL']
+        self.responses = LRUCache()
+        self._client: Optional[httpx.Client] = None
+
+    @property
+    def client(self) -> httpx.Client:
+        """HTTP client shared by the synchronous requests of this instance."""
+        if self._client is None:
+            self._client = create_client()
+        return self._client
+
+    def close(self) -> None:
+        """Close the shared HTTP client, if it was opened."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def __enter__(self) -> 'CnpjAPI':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def fetch_company_info(self, cnpj: str) -> Dict:
-        with httpx.Client() as client:
-            url = self.base_url.format(cnpj)
-            cnpjapi_logger.info(
-                f'Fetching data from {str.upper(self.webservice)} for CNPJ: {cnpj}'
-            )
-            cnpjapi_logger.info(f'URL: {url}')
-            try:
-                response = client.get(url)
-                if response.status_code != 200:
-                    raise APIRequestError(
-                        f'Failed to fetch data from {url} of {str.upper(self.webservice)}.'
-                    )
-                response.raise_for_status()
-                return response.json()
-
-            except (httpx.RequestError, httpx.HTTPStatusError) as exc:
+        cached = self.responses.get(cnpj)
+        if cached is not None:
+            return cached
+
+        url = self.base_url.format(cnpj)
+        cnpjapi_logger.info(
+            f'Fetching data from {str.upper(self.webservice)} for CNPJ: {cnpj}'
+        )
+        cnpjapi_logger.info(f'URL: {url}')
+        try:
+            response = self.client.get(url)
+            if response.status_code != 200:
                 raise APIRequestError(
-                    f"An error occurred while requesting '{url}' from {str.upper(self.webservice)}: {exc}"
-                ) from exc
+                    f'Failed to fetch data from {url} of {str.upper(self.webservice)}.'
+                )
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            self.responses.set(cnpj, data)
+            return data
+
+        except (httpx.RequestError, httpx.HTTPStatusError) as exc:
+            raise APIRequestError(
+                f"An error occurred while requesting '{url}' from {str.upper(self.webservice)}: {exc}"
+            ) from exc
+        except orjson.JSONDecodeError as exc:
+            raise APIRequestError(
+                f"Invalid JSON returned by '{url}' from {str.upper(self.webservice)}: {exc}"
+            ) from exc
+
+    async def fetch_company_info_async(
+        self, client: httpx.AsyncClient, cnpj: str
+    ) -> Dict:
+        cached = self.responses.get(cnpj)
+        if cached is not None:
+            return cached
+
+        url = self.base_url.format(cnpj)
+        cnpjapi_logger.info(
+            f'Fetching data from {str.upper(self.webservice)} for CNPJ: {cnpj}'
+        )
+        cnpjapi_logger.info(f'URL: {url}')
+        try:
+            response = await get_with_backoff(client, url)
+            if response.status_code != 200:
+                raise APIRequestError(
+                    f'Failed to fetch data from {url} of {str.upper(self.webservice)}.'
+                )
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            self.responses.set(cnpj, data)
+            return data
+
+        except (httpx.RequestError, httpx.HTTPStatusError) as exc:
+            raise APIRequestError(
+                f"An error occurred while requesting '{url}' from {str.upper(self.webservice)}: {exc}"
+            ) from exc
+        except orjson.JSONDecodeError as exc:
+            raise APIRequestError(
+                f"Invalid JSON returned by '{url}' from {str.upper(self.webservice)}: {exc}"
+            ) from exc
 
     def _sanitize_cnpj(self, cnpj: str) -> str:
         return (
@@ -147,44 +240,70 @@ class CnpjAPI:
         )
 
     def _cnpj_match(self, cnpj: str, response: Dict) -> bool:
-        validator = CNPJValidator(cnpj)
+        sanitized_cnpj = self._sanitize_cnpj(cnpj)
 
         if self.webservice in ['brasilapi', 'receitaws']:
             response_cnpj = response.get('cnpj', '')
             sanitized_response_cnpj = self._sanitize_cnpj(response_cnpj)
-            return validator.sanitized_cnpj == sanitized_response_cnpj
+            return sanitized_cnpj == sanitized_response_cnpj
         elif self.webservice == 'brasilaberto':
             base_cnpj = response.get('result', {}).get('baseCnpj', '')
-            return validator.sanitized_cnpj[:8] == base_cnpj[:8]
+            return sanitized_cnpj[:8] == base_cnpj[:8]
         return False
 
-    def validate_cnpj(self, cnpj_str: str) -> Dict:
+    def _set_company_result(
+        self, result: Dict, sanitized_cnpj: str, company_info: Dict
+    ) -> Dict:
+        result['company_info'] = company_info
+        if self._cnpj_match(sanitized_cnpj, company_info):
+            result['valid'] = True
+            result['reason'] = 'Valid CNPJ.'
+        else:
+            result['valid'] = False
+            result[
+                'reason'
+            ] = f'This CNPJ was not found in the API base {self.webservice}.'
+        return result
+
+    @staticmethod
+    def _validate_locally(cnpj_str: str) -> Tuple[Dict, Optional[str]]:
+        """
+        Check the format and check digits of a CNPJ before any request.
+
+        Returns:
+            Tuple[Dict, Optional[str]]: The result so far and the sanitized
+                CNPJ, which is None when the CNPJ was already rejected.
+        """
         result = {'cnpj': cnpj_str}
         try:
             validator = CNPJValidator(cnpj_str)
-            if not validator.validate():
-                result['valid'] = False
-                result['reason'] = 'Invalid CNPJ.'
-                return result
-
-            company_info = self.fetch_company_info(validator.sanitized_cnpj)
-            if not self._cnpj_match(validator.sanitized_cnpj, company_info):
-                result['valid'] = False
-                result[
-                    'reason'
-                ] = f'This CNPJ was not found in the API base {self.webservice}.'
-            result['company_info'] = company_info
-            result['valid'] = True
-            result['reason'] = 'Valid CNPJ.'
-        except (CNPJValueError, APIRequestError) as e:
+        except CNPJValueError as e:
             result['valid'] = False
             result['reason'] = str(e)
-        except Exception as e:
+            return result, None
+
+        local_result = validator.validate()
+        if not local_result['valid']:
             result['valid'] = False
-            result['reason'] = str(e)
-        finally:
+            result['reason'] = local_result['reason']
+            return result, None
+
+        return result, validator.sanitized_cnpj
+
+    def validate_cnpj(self, cnpj_str: str) -> Dict:
+        result, sanitized_cnpj = self._validate_locally(cnpj_str)
+        if sanitized_cnpj is None:
             return result
 
+        try:
+            company_info = self.fetch_company_info(sanitized_cnpj)
+            self._set_company_result(result, sanitized_cnpj, company_info)
+        except APIRequestError as e:
+            result['valid'] = False
+            result['reason'] = str(e)
+
+        return result
+
     def validate_cnpjs(self) -> List[Dict]:
         results = []
         for cnpj in self.cnpj_list:
@@ -192,3 +311,87 @@ class CnpjAPI:
             results.append(result)
 
         return results
+
+    async def validate_cnpj_async(
+        self, client: httpx.AsyncClient, cnpj_str: str
+    ) -> Dict:
+        result, sanitized_cnpj = self._validate_locally(cnpj_str)
+        if sanitized_cnpj is None:
+            return result
+
+        try:
+            company_info = await self.fetch_company_info_async(
+                client, sanitized_cnpj
+            )
+            self._set_company_result(result, sanitized_cnpj, company_info)
+        except APIRequestError as e:
+            result['valid'] = False
+            result['reason'] = str(e)
+
+        return result
+
+    async def validate_cnpjs_async(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        concurrency: int = 10,
+        rate_limiter: Optional[AsyncRateLimiter] = None,
+    ) -> List[Dict]:
+        """
+        Validate the CNPJs of `self.cnpj_list` concurrently.
+
+        Every CNPJ is first checked locally; only the distinct ones that pass
+        are requested, so invalid or repeated CNPJs never reach the network.
+
+        Args:
+            client (Optional[httpx.AsyncClient]): Shared client used for the
+                requests. A pooled client is created when omitted.
+            concurrency (int): Maximum number of requests in flight.
+            rate_limiter (Optional[AsyncRateLimiter]): Paces the requests.
+
+        Returns:
+            List[Dict]: One result per CNPJ, in order.
+        """
+        if client is None:
+            async with create_async_client(concurrency) as client:
+                return await self.validate_cnpjs_async(
+                    client, concurrency, rate_limiter
+                )
+
+        local_results = [
+            self._validate_locally(cnpj) for cnpj in self.cnpj_list
+        ]
+        pending = list(
+            dict.fromkeys(
+                sanitized_cnpj
+                for _, sanitized_cnpj in local_results
+                if sanitized_cnpj is not None
+            )
+        )
+
+        async def fetch(cnpj: str):
+            try:
+                return await self.fetch_company_info_async(client, cnpj)
+            except APIRequestError as e:
+                return e
+
+        responses = dict(
+            zip(
+                pending,
+                await gather_limited(
+                    fetch, pending, concurrency, rate_limiter
+                ),
+            )
+        )
+
+        results = []
+        for result, sanitized_cnpj in local_results:
+            if sanitized_cnpj is not None:
+                response = responses[sanitized_cnpj]
+                if isinstance(response, APIRequestError):
+                    result['valid'] = False
+                    result['reason'] = str(response)
+                else:
+                    self._set_company_result(result, sanitized_cnpj, response)
+            results.append(result)
+
+        return results
@@ -1,6 +1,28 @@
+from operator import mul
 from typing import Dict, List, Union
 
-from validate_docbr import CPF
+from kami_dataset_validator.constants import CHECK_DIGIT_WEIGHTS
+
+CPF_EMPTY_ERROR = 'Empty CPF.'
+CPF_FORMAT_ERROR = 'Invalid CPF format. Ensure it contains only numbers.'
+CPF_LENGTH_ERROR = 'Invalid CPF length. Ensure it has 11 digits.'
+CPF_INVALID_ERROR = 'The provided CPF is not valid.'
+CPF_FIRST_WEIGHTS, CPF_SECOND_WEIGHTS = CHECK_DIGIT_WEIGHTS['cpf']
+
+
+def _has_valid_check_digits(cpf: str) -> bool:
+    """Checks the modulo-11 check digits of a sanitized 11-digit CPF.
+
+    Matches `validate_docbr.CPF().validate`, including the rejection of
+    CPFs made of a single repeated digit, without its per-call list and
+    string conversions.
+    """
+    if cpf == cpf[0] * 11:
+        return False
+    digits = [ord(char) - 48 for char in cpf]
+    first = sum(map(mul, digits, CPF_FIRST_WEIGHTS)) * 10 % 11 % 10
+    second = sum(map(mul, digits, CPF_SECOND_WEIGHTS)) * 10 % 11 % 10
+    return first == digits[9] and second == digits[10]
 
 
 class CPFValueError(Exception):
@@ -15,25 +37,31 @@ class CPFValidator:
         self.sanitized_cpf = self._sanitize_cpf()
 
     def _sanitize_cpf(self) -> str:
+        if not self.cpf:
+            raise CPFValueError(CPF_EMPTY_ERROR)
+
+        if not isinstance(self.cpf, str):
+            raise CPFValueError(CPF_FORMAT_ERROR)
+
         sanitized_cpf = (
             self.cpf.replace('.', '').replace('-', '').replace(',', '')
         )
 
-        if not sanitized_cpf.isdigit():
-            raise CPFValueError(
-                'Invalid CPF format. Ensure it contains only numbers.'
-            )
+        if not (sanitized_cpf.isascii() and sanitized_cpf.isdigit()):
+            raise CPFValueError(CPF_FORMAT_ERROR)
 
         if len(sanitized_cpf) != 11:
-            raise CPFValueError('Invalid CPF length. Ensure it has 11 digits.')
+            raise CPFValueError(CPF_LENGTH_ERROR)
 
         return sanitized_cpf
 
-    def validate(self) -> bool:
-        cpf_validator = CPF()
+    def is_valid(self) -> bool:
+        """Checks the CPF check digits without raising on failure."""
+        return _has_valid_check_digits(self.sanitized_cpf)
 
-        if not cpf_validator.validate(self.sanitized_cpf):
-            raise CPFValueError('The provided CPF is not valid.')
+    def validate(self) -> bool:
+        if not self.is_valid():
+            raise CPFValueError(CPF_INVALID_ERROR)
 
         return True
 
@@ -46,16 +74,14 @@ class CPFValidator:
         for cpf in cpfs:
             result = {'cpf': cpf}
             try:
-                cpf_validator = cls(cpf)
-                is_valid = cpf_validator.validate()
+                is_valid = cls(cpf).is_valid()
                 result['valid'] = is_valid
-                result['reason'] = 'Valid CPF.' if is_valid else 'Invalid CPF.'
+                result['reason'] = (
+                    'Valid CPF.' if is_valid else CPF_INVALID_ERROR
+                )
             except CPFValueError as e:
                 result['valid'] = False
                 result['reason'] = str(e)
-            except Exception as e:
-                result['valid'] = False
-                result['reason'] = str(e)
 
             results.append(result)
 
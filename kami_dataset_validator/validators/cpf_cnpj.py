@@ -1,9 +1,19 @@
-from validate_docbr import CPF, CNPJ
+from kami_dataset_validator.validators.cnpj import (
+    CNPJValidator,
+    CNPJValueError,
+)
+from kami_dataset_validator.validators.cpf import CPFValidator, CPFValueError
+
 
 def validate_cpf(cpf):
-    cpf_validator = CPF()
-    return cpf_validator.validate(cpf)
+    try:
+        return CPFValidator(cpf).is_valid()
+    except CPFValueError:
+        return False
+
 
 def validate_cnpj(cnpj):
-    cnpj_validator = CNPJ()
-    return cnpj_validator.validate(cnpj)
\ No newline at end of file
+    try:
+        return CNPJValidator(cnpj).is_valid()
+    except CNPJValueError:
+        return False
@@ -1,29 +1,75 @@
-from typing import Dict, List, Union
+from functools import lru_cache
+from typing import Dict, Iterable, List, Union
 
+import dns.asyncresolver
+from dns.exception import DNSException
+from dns.resolver import Resolver
 from email_validator import (
     EmailNotValidError,
-    EmailSyntaxError,
-    EmailUndeliverableError,
+    caching_resolver,
     validate_email,
 )
 
+from kami_dataset_validator.concurrency import gather_limited, run_sync
+
+MX_CONCURRENCY = 20
+
+
+@lru_cache(maxsize=None)
+def _dns_resolver() -> Resolver:
+    """DNS resolver shared by every deliverability check, built once.
+
+    Its answers are cached by domain, so addresses sharing a domain pay for
+    a single MX lookup.
+    """
+    return caching_resolver()
+
+
+async def _prefetch_mx(
+    domains: Iterable[str], concurrency: int = MX_CONCURRENCY
+) -> None:
+    """Resolves the MX records of `domains` concurrently into the cache of
+    the shared resolver.
+
+    The deliverability checks that follow are then answered from the cache
+    instead of waiting on one DNS round trip per domain. Lookup failures are
+    left for those checks to report.
+    """
+    shared_resolver = _dns_resolver()
+    resolver = dns.asyncresolver.Resolver()
+    resolver.cache = shared_resolver.cache
+    resolver.lifetime = shared_resolver.lifetime
+
+    async def resolve(domain: str) -> None:
+        try:
+            await resolver.resolve(domain, 'MX')
+        except DNSException:
+            pass
+
+    await gather_limited(resolve, domains, concurrency)
+
 
 class EmailValidator:
     def __init__(self, email: str):
         self.email = email
         self.validated_email = ''
         self.deliverability = False
+        self.reason = ''
         self.validate()
 
     def validate(self) -> bool:
         try:
             validation_result = validate_email(
-                self.email, check_deliverability=True
+                self.email,
+                check_deliverability=True,
+                dns_resolver=_dns_resolver(),
             )
             self.validated_email = validation_result.email
             self.deliverability = validation_result.mx is not None
+            self.reason = 'Valid email.'
             return True
-        except EmailNotValidError:
+        except EmailNotValidError as e:
+            self.reason = str(e) or 'Invalid email.'
             return False
 
     @classmethod
@@ -31,6 +77,14 @@ class EmailValidator:
         cls, emails: List[str]
     ) -> List[Dict[str, Union[str, bool]]]:
         results = []
+        domains = {
+            email.rpartition('@')[2].strip().lower()
+            for email in emails
+            if isinstance(email, str) and '@' in email
+        }
+        domains.discard('')
+        if domains:
+            run_sync(_prefetch_mx(domains))
 
         for email in emails:
             email_validator = cls(email)
@@ -38,21 +92,8 @@ class EmailValidator:
                 'email': email,
                 'valid': email_validator.validated_email != '',
                 'deliverability': email_validator.deliverability,
-                'reason': 'Valid email.'
-                if email_validator.validated_email != ''
-                else 'Invalid email.',
+                'reason': email_validator.reason,
             }
-
-            if not result['valid']:
-                try:
-                    validate_email(email, check_deliverability=True)
-                except EmailSyntaxError as e:
-                    result['reason'] = str(e)
-                except EmailUndeliverableError as e:
-                    result['reason'] = str(e)
-                except EmailNotValidError as e:
-                    result['reason'] = str(e)
-
             results.append(result)
 
         return results
@@ -1,8 +1,46 @@
-from typing import Dict, List, Union
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain, repeat
+from multiprocessing import get_context
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar, Union
 
 import phonenumbers
 from phonenumbers import PhoneNumberType
 
+from kami_dataset_validator.constants import COMPILED_PATTERNS
+
+PHONE_FORMAT_ERROR = 'Invalid phone number format.'
+PHONE_INVALID_ERROR = 'The provided phone number is not valid.'
+PHONE_VALID = 'Valid phone number.'
+PHONE_RESULT_FIELDS = ('valid', 'possible_mobile', 'reason')
+PARSE_CACHE_SIZE = 4096
+PARALLEL_MIN_NUMBERS = 10_000
+T = TypeVar('T')
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse(
+    phone_number: Optional[str], default_region: Optional[str]
+) -> phonenumbers.PhoneNumber:
+    """Parses a phone number once per distinct number and region."""
+    return phonenumbers.parse(phone_number, default_region)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _is_valid_number(
+    phone_number: Optional[str], default_region: Optional[str]
+) -> bool:
+    """Looks up the validity metadata once per distinct number and region."""
+    return phonenumbers.is_valid_number(_parse(phone_number, default_region))
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _number_type(
+    phone_number: Optional[str], default_region: Optional[str]
+) -> int:
+    """Looks up the number type once per distinct number and region."""
+    return phonenumbers.number_type(_parse(phone_number, default_region))
+
 
 class PhoneValueError(Exception):
     """Exception raised when a phone number value is invalid."""
@@ -11,58 +49,193 @@ class PhoneValueError(Exception):
 
 
 class PhoneValidator:
-    def __init__(self, phone_number: str):
+    __slots__ = ('phone_number', 'default_region', 'parsed_phone_number')
+
+    def __init__(
+        self, phone_number: str, default_region: Optional[str] = None
+    ):
         self.phone_number = phone_number
+        self.default_region = default_region
         self.parsed_phone_number = self._parse_phone_number()
 
     def _parse_phone_number(self) -> phonenumbers.PhoneNumber:
+        if self.phone_number is not None and not (
+            isinstance(self.phone_number, str)
+            and COMPILED_PATTERNS['phone'].fullmatch(self.phone_number)
+        ):
+            raise PhoneValueError(PHONE_FORMAT_ERROR)
         try:
-            return phonenumbers.parse(self.phone_number)
+            return _parse(self.phone_number, self.default_region)
         except phonenumbers.NumberParseException as e:
             raise PhoneValueError(str(e))
 
     def is_possible_mobile(self) -> bool:
         return (
-            phonenumbers.number_type(self.parsed_phone_number)
+            _number_type(self.phone_number, self.default_region)
             == PhoneNumberType.MOBILE
         )
 
+    def is_valid(self) -> bool:
+        """Checks the parsed number without raising on failure."""
+        return _is_valid_number(self.phone_number, self.default_region)
+
     def validate(self) -> bool:
-        is_valid = phonenumbers.is_valid_number(self.parsed_phone_number)
-        if not is_valid:
-            raise PhoneValueError('The provided phone number is not valid.')
+        if not self.is_valid():
+            raise PhoneValueError(PHONE_INVALID_ERROR)
         return True
 
     @classmethod
     def validate_phone_numbers(
-        cls, phone_numbers: List[str]
+        cls,
+        phone_numbers: List[str],
+        default_region: Optional[str] = None,
+        max_workers: Optional[int] = None,
     ) -> List[Dict[str, Union[str, bool]]]:
-        results = []
-
-        for number in phone_numbers:
-            result = {'phone_number': number}
-            try:
-                phone_number_validator = cls(number)
-                is_valid = phone_number_validator.validate()
-                is_possible_mobile = (
-                    phone_number_validator.is_possible_mobile()
-                )
-                result['valid'] = is_valid
-                result['possible_mobile'] = is_possible_mobile
-                result['reason'] = (
-                    'Valid phone number.'
-                    if is_valid
-                    else 'Invalid phone number.'
+        """Validates a batch of phone numbers.
+
+        Numbers are validated in this process unless `max_workers` asks
+        for more than one worker, in which case batches of at least
+        `PARALLEL_MIN_NUMBERS` numbers are split into chunks validated by a
+        pool of spawned worker processes. Callers opting in must run under
+        an ``if __name__ == '__main__'`` guard.
+
+        Args:
+            phone_numbers (List[str]): The phone numbers to validate.
+            default_region (Optional[str]): Region, such as 'BR', assumed for
+                numbers written without a '+' country code. By default such
+                numbers are rejected.
+            max_workers (Optional[int]): Number of worker processes. By
+                default no process pool is used.
+
+        Returns:
+            List[Dict[str, Union[str, bool]]]: One result per phone number.
+        """
+        return list(
+            chain.from_iterable(
+                _map_chunks(
+                    _validate_phone_numbers,
+                    phone_numbers,
+                    default_region,
+                    max_workers,
                 )
-            except PhoneValueError as e:
-                result['valid'] = False
-                result['possible_mobile'] = False
-                result['reason'] = str(e)
-            except Exception as e:
-                result['valid'] = False
-                result['possible_mobile'] = False
-                result['reason'] = str(e)
-
-            results.append(result)
-
-        return results
+            )
+        )
+
+    @classmethod
+    def validate_phone_numbers_columns(
+        cls,
+        phone_numbers: List[str],
+        default_region: Optional[str] = None,
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, List[Union[str, bool]]]:
+        """Validates a batch of phone numbers into result columns.
+
+        Same as `validate_phone_numbers`, but the results are returned as
+        one list per field instead of one dict per number, which keeps large
+        batches compact and ready to become DataFrame columns.
+
+        Args:
+            phone_numbers (List[str]): The phone numbers to validate.
+            default_region (Optional[str]): Region assumed for numbers
+                written without a '+' country code.
+            max_workers (Optional[int]): Number of worker processes. By
+                default no process pool is used.
+
+        Returns:
+            Dict[str, List[Union[str, bool]]]: The 'valid', 'possible_mobile'
+            and 'reason' columns, in the order of `phone_numbers`.
+        """
+        columns = {field: [] for field in PHONE_RESULT_FIELDS}
+        for chunk_columns in _map_chunks(
+            _validate_phone_numbers_columns,
+            phone_numbers,
+            default_region,
+            max_workers,
+        ):
+            for field in PHONE_RESULT_FIELDS:
+                columns[field].extend(chunk_columns[field])
+        return columns
+
+
+def _map_chunks(
+    validate_chunk: Callable[[List[str], Optional[str]], T],
+    phone_numbers: List[str],
+    default_region: Optional[str],
+    max_workers: Optional[int],
+) -> List[T]:
+    """Applies `validate_chunk` to the batch, in worker processes if asked."""
+    if (
+        max_workers is None
+        or max_workers < 2
+        or len(phone_numbers) < PARALLEL_MIN_NUMBERS
+    ):
+        return [validate_chunk(phone_numbers, default_region)]
+
+    chunk_size = -(-len(phone_numbers) // (4 * max_workers))
+    chunks = [
+        phone_numbers[start : start + chunk_size]
+        for start in range(0, len(phone_numbers), chunk_size)
+    ]
+    with ProcessPoolExecutor(
+        max_workers, mp_context=get_context('spawn')
+    ) as executor:
+        return list(
+            executor.map(validate_chunk, chunks, repeat(default_region))
+        )
+
+
+def _validate_phone_number(
+    phone_number: str, default_region: Optional[str]
+) -> Tuple[bool, bool, str]:
+    """Returns whether a number is valid, possibly mobile, and why."""
+    try:
+        phone_number_validator = PhoneValidator(phone_number, default_region)
+    except PhoneValueError as e:
+        return False, False, str(e)
+
+    if not phone_number_validator.is_valid():
+        return False, False, PHONE_INVALID_ERROR
+    return True, phone_number_validator.is_possible_mobile(), PHONE_VALID
+
+
+def _validate_phone_numbers(
+    phone_numbers: List[str], default_region: Optional[str] = None
+) -> List[Dict[str, Union[str, bool]]]:
+    """Validates phone numbers one by one, in this or a worker process."""
+    results = []
+
+    for number in phone_numbers:
+        valid, possible_mobile, reason = _validate_phone_number(
+            number, default_region
+        )
+        results.append(
+            {
+                'phone_number': number,
+                'valid': valid,
+                'possible_mobile': possible_mobile,
+                'reason': reason,
+            }
+        )
+
+    return results
+
+
+def _validate_phone_numbers_columns(
+    phone_numbers: List[str], default_region: Optional[str] = None
+) -> Dict[str, List[Union[str, bool]]]:
+    """Validates phone numbers into one list per result field."""
+    valid, possible_mobile, reason = [], [], []
+
+    for number in phone_numbers:
+        number_valid, number_mobile, number_reason = _validate_phone_number(
+            number, default_region
+        )
+        valid.append(number_valid)
+        possible_mobile.append(number_mobile)
+        reason.append(number_reason)
+
+    return {
+        'valid': valid,
+        'possible_mobile': possible_mobile,
+        'reason': reason,
+    }
@@ -0,0 +1,83 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from kami_dataset_validator import cache
+from kami_dataset_validator.cache import LRUCache, cache_clear, get_cache
+
+
+class TestDiskCache(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+        patcher = patch.object(cache, 'CACHE_DIR', self.cache_dir.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        get_cache.cache_clear()
+        self.addCleanup(get_cache.cache_clear)
+        self.addCleanup(self._close_caches)
+
+    def _close_caches(self):
+        for name in cache.CACHE_NAMES:
+            get_cache(name).close()
+
+    def test_get_cache_is_opened_once_under_cache_dir(self):
+        """Test that each lookup kind has one cache inside CACHE_DIR."""
+        cep_cache = get_cache('cep')
+        self.assertIs(get_cache('cep'), cep_cache)
+        self.assertIsNot(get_cache('cnpj'), cep_cache)
+        self.assertEqual(
+            cep_cache.directory, os.path.join(self.cache_dir.name, 'cep')
+        )
+
+    def test_cache_clear_empties_every_cache(self):
+        """Test that cache_clear removes the CEP and CNPJ entries."""
+        get_cache('cep').set(('viacep', '01001000'), {'valid': True})
+        get_cache('cnpj').set(('brasilapi', '11222333000181'), {'valid': True})
+
+        cache_clear()
+
+        self.assertEqual(len(get_cache('cep')), 0)
+        self.assertEqual(len(get_cache('cnpj')), 0)
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_get_missing_key(self):
+        """Test that a missing key returns None."""
+        self.assertIsNone(LRUCache().get('missing'))
+
+    def test_evicts_least_recently_used(self):
+        """Test that reading a key protects it from eviction."""
+        lru = LRUCache(maxsize=2)
+        lru.set('a', 1)
+        lru.set('b', 2)
+        lru.get('a')
+        lru.set('c', 3)
+
+        self.assertEqual(len(lru), 2)
+        self.assertEqual(lru.get('a'), 1)
+        self.assertIsNone(lru.get('b'))
+        self.assertEqual(lru.get('c'), 3)
+
+    def test_set_existing_key_updates_value(self):
+        """Test that setting an existing key replaces it without growing."""
+        lru = LRUCache(maxsize=2)
+        lru.set('a', 1)
+        lru.set('a', 2)
+
+        self.assertEqual(len(lru), 1)
+        self.assertEqual(lru.get('a'), 2)
+
+    def test_clear(self):
+        """Test that clear removes every entry."""
+        lru = LRUCache()
+        lru.set('a', 1)
+        lru.clear()
+
+        self.assertEqual(len(lru), 0)
+        self.assertIsNone(lru.get('a'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
+import asyncio
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 
@@ -45,6 +46,13 @@ class TestAddress(unittest.TestCase):
             'siafi': '1234',
         }
 
+    def test_address_is_slotted(self):
+        """Test that addresses store their fields in slots."""
+        address = Address(cep='12345-678', city='SAO PAULO')
+        self.assertFalse(hasattr(address, '__dict__'))
+        self.assertEqual(address.city, 'SAO PAULO')
+        self.assertIsNone(address.street)
+
     @patch(
         'kami_dataset_validator.validators.cep.ufbr', new_callable=MockedUFBR
     )
@@ -57,6 +65,11 @@ class TestAddress(unittest.TestCase):
         with self.assertRaises(CEPFormatError):
             address.sanitize_cep()
 
+    def test_sanitize_cep_non_ascii_digits(self):
+        address = Address(cep='0100\uff11000')
+        with self.assertRaises(CEPFormatError):
+            address.sanitize_cep()
+
     def test_sanitize_cep_invalid_length(self):
         address = Address(cep='12345-6')
         with self.assertRaises(CEPFormatError):
@@ -122,12 +135,24 @@ class TestCepAPI(unittest.TestCase):
     def test_fetch_by_cep_success(self, mock_get):
         """Test successful fetch by CEP."""
         mock_get.return_value = MagicMock(
-            status_code=200, json=lambda: {'cep': '01000000'}
+            status_code=200, content=b'{"cep": "01000000"}'
         )
         api = CepAPI()
         response = api._fetch_by_cep('01000000')
         self.assertEqual(response, {'cep': '01000000'})
 
+    @patch('httpx.Client.get')
+    def test_fetch_by_cep_memoized(self, mock_get):
+        """Test that a repeated CEP is answered without a new request."""
+        mock_get.return_value = MagicMock(
+            status_code=200, content=b'{"cep": "01000000"}'
+        )
+        api = CepAPI()
+        first = api._fetch_by_cep('01000000')
+        second = api._fetch_by_cep('01000000')
+        self.assertEqual(first, second)
+        mock_get.assert_called_once()
+
     @patch('httpx.Client.get')
     def test_fetch_by_cep_failure(self, mock_get):
         """Test fetch by CEP failure due to HTTP error."""
@@ -138,6 +163,45 @@ class TestCepAPI(unittest.TestCase):
         with self.assertRaises(APIRequestError):
             api._fetch_by_cep('01000000')
 
+    @patch('httpx.Client.get')
+    def test_fetch_by_cep_reuses_client(self, mock_get):
+        """Test that successive fetches share one HTTP client."""
+        mock_get.return_value = MagicMock(
+            status_code=200, content=b'{"cep": "01000000"}'
+        )
+        api = CepAPI()
+        api._fetch_by_cep('01000000')
+        client = api.client
+        api._fetch_by_cep('02000000')
+        self.assertIs(api.client, client)
+        self.assertEqual(mock_get.call_count, 2)
+        api.close()
+        self.assertTrue(client.is_closed)
+
+    def test_fetch_by_cep_async_success(self):
+        """Test successful asynchronous fetch by CEP."""
+        client = MagicMock()
+        client.get = AsyncMock(
+            return_value=MagicMock(
+                status_code=200, content=b'{"cep": "01000000"}'
+            )
+        )
+        api = CepAPI()
+        response = asyncio.run(api._fetch_by_cep_async(client, '01000000'))
+        self.assertEqual(response, {'cep': '01000000'})
+
+    def test_fetch_by_cep_async_failure(self):
+        """Test asynchronous fetch by CEP failure due to HTTP error."""
+        client = MagicMock()
+        client.get = AsyncMock(
+            side_effect=httpx.HTTPStatusError(
+                'Not Found', request=MagicMock(), response=MagicMock()
+            )
+        )
+        api = CepAPI()
+        with self.assertRaises(APIRequestError):
+            asyncio.run(api._fetch_by_cep_async(client, '01000000'))
+
     def test_compute_similarity(self):
         """Test computing similarity between two addresses."""
         api = CepAPI()
@@ -157,6 +221,19 @@ class TestCepAPI(unittest.TestCase):
         self.assertGreaterEqual(len(results), 1)
         self.assertGreaterEqual(results[0]['similarity_ratio'], 0.0)
 
+    def test_filter_addresses_by_similarity_limit(self):
+        """Test keeping only the most similar addresses."""
+        api = CepAPI()
+        search_addresses = [self.address2, self.address1]
+        results = api.filter_addresses_by_similarity(
+            self.address1, search_addresses
+        )
+        limited = api.filter_addresses_by_similarity(
+            self.address1, search_addresses, limit=1
+        )
+        self.assertEqual(limited, results[:1])
+        self.assertEqual(limited[0]['similarity_ratio'], 1.0)
+
     def test_supports_address(self):
         """Test checking if the webservice supports address fetching."""
         api = CepAPI(webservice='viacep')
@@ -170,6 +247,45 @@ class TestCepAPI(unittest.TestCase):
         result = api.validate_address(self.address1)
         self.assertTrue(result['valid'])
 
+    @patch('kami_dataset_validator.validators.cep.CepAPI._fetch_by_cep')
+    def test_validate_address_local_only(self, mock_fetch_by_cep):
+        """Test that a local-only validation never calls the webservice."""
+        api = CepAPI()
+        result = api.validate_address(self.address1, local_only=True)
+        self.assertTrue(result['valid'])
+        mock_fetch_by_cep.assert_not_called()
+
+    @patch('kami_dataset_validator.validators.cep.CepAPI._fetch_by_cep_async')
+    def test_validate_address_async(self, mock_fetch_by_cep_async):
+        """Test validating an address asynchronously."""
+        mock_fetch_by_cep_async.return_value = {'cep': '01000000'}
+        api = CepAPI()
+        result = asyncio.run(
+            api.validate_address_async(MagicMock(), self.address1)
+        )
+        self.assertTrue(result['valid'])
+
+    @patch('kami_dataset_validator.validators.cep.CepAPI._fetch_by_cep_async')
+    def test_validate_address_async_invalid_cep(self, mock_fetch_by_cep_async):
+        """Test that an invalid CEP is rejected before any request."""
+        api = CepAPI()
+        result = asyncio.run(
+            api.validate_address_async(MagicMock(), Address(cep='123'))
+        )
+        self.assertFalse(result['valid'])
+        mock_fetch_by_cep_async.assert_not_called()
+
+    @patch('kami_dataset_validator.validators.cep.CepAPI._fetch_by_cep_async')
+    def test_validate_addresses_async(self, mock_fetch_by_cep_async):
+        """Test validating several addresses concurrently, keeping order."""
+        mock_fetch_by_cep_async.side_effect = lambda client, cep: {
+            'cep': cep if cep == '01000000' else None
+        }
+        api = CepAPI(addresses=[self.address1, self.address2])
+        results = asyncio.run(api.validate_addresses_async(concurrency=2))
+        self.assertEqual([r['valid'] for r in results], [True, False])
+        self.assertEqual(api.results, results)
+
     @patch('kami_dataset_validator.validators.cep.CepAPI.validate_address')
     def test_validate_addresses(self, mock_validate_address):
         """Test validating multiple addresses."""
@@ -1,5 +1,6 @@
+import asyncio
 import unittest
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import httpx
 
@@ -32,6 +33,18 @@ class TestCNPJValidator(unittest.TestCase):
         validator = CNPJValidator(cnpj)
         self.assertTrue(validator.validate())
 
+    def test_validate_cnpj_check_digits(self):
+        """Test that wrong or repeated check digits are rejected."""
+        self.assertTrue(CNPJValidator('11222333000181').validate()['valid'])
+        self.assertFalse(CNPJValidator('11222333000182').validate()['valid'])
+        self.assertFalse(CNPJValidator('00000000000000').validate()['valid'])
+
+    def test_is_valid_check_digits(self):
+        """Test the check-digit verdict without the result dict."""
+        self.assertTrue(CNPJValidator('11.222.333/0001-81').is_valid())
+        self.assertFalse(CNPJValidator('11222333000182').is_valid())
+        self.assertFalse(CNPJValidator('11111111111111').is_valid())
+
     def test_validate_cnpj_invalid_format(self):
         """Test CNPJ validation with invalid format."""
         cnpj = 'invalid_cnpj_format'
@@ -55,12 +68,23 @@ class TestConsultaCnpjAPI(unittest.TestCase):
     def test_fetch_company_info_success(self, mock_get):
         """Test successful fetch of company info."""
         mock_get.return_value = MagicMock(
-            status_code=200, json=lambda: {'cnpj': '12345678000195'}
+            status_code=200, content=b'{"cnpj": "12345678000195"}'
         )
         api = CnpjAPI(cnpj_list=['12.345.678/0001-95'])
         response = api.fetch_company_info('12345678000195')
         self.assertEqual(response, {'cnpj': '12345678000195'})
 
+    @patch('httpx.Client.get')
+    def test_context_manager_closes_client(self, mock_get):
+        """Test that leaving the context closes the shared client."""
+        mock_get.return_value = MagicMock(
+            status_code=200, content=b'{"cnpj": "12345678000195"}'
+        )
+        with CnpjAPI(cnpj_list=['12345678000195']) as api:
+            api.fetch_company_info('12345678000195')
+            client = api.client
+        self.assertTrue(client.is_closed)
+
     @patch('httpx.Client.get')
     def test_fetch_company_info_failure(self, mock_get):
         """Test fetch company info failure due to HTTP error."""
@@ -71,6 +95,32 @@ class TestConsultaCnpjAPI(unittest.TestCase):
         with self.assertRaises(APIRequestError):
             api.fetch_company_info('12345678901234')
 
+    def test_fetch_company_info_async_success(self):
+        """Test successful asynchronous fetch of company info."""
+        client = MagicMock()
+        client.get = AsyncMock(
+            return_value=MagicMock(
+                status_code=200, content=b'{"cnpj": "12345678000195"}'
+            )
+        )
+        api = CnpjAPI()
+        response = asyncio.run(
+            api.fetch_company_info_async(client, '12345678000195')
+        )
+        self.assertEqual(response, {'cnpj': '12345678000195'})
+
+    def test_fetch_company_info_async_failure(self):
+        """Test asynchronous fetch of company info failure due to HTTP error."""
+        client = MagicMock()
+        client.get = AsyncMock(
+            side_effect=httpx.HTTPStatusError(
+                'Not Found', request=MagicMock(), response=MagicMock()
+            )
+        )
+        api = CnpjAPI()
+        with self.assertRaises(APIRequestError):
+            asyncio.run(api.fetch_company_info_async(client, '12345678901234'))
+
     def test_cnpj_match(self):
         """Test CNPJ matching process."""
         api = CnpjAPI()
@@ -81,13 +131,95 @@ class TestConsultaCnpjAPI(unittest.TestCase):
     @patch.object(
         CnpjAPI, 'fetch_company_info', return_value={'cnpj': '12345678000195'}
     )
-    @patch.object(CNPJValidator, 'validate', return_value=True)
+    @patch.object(
+        CNPJValidator,
+        'validate',
+        return_value={'valid': True, 'reason': 'Valid CNPJ.'},
+    )
     def test_validate_cnpj(self, mock_validate, mock_fetch):
         """Test CNPJ validation process."""
         api = CnpjAPI(cnpj_list=['12.345.678/0001-95'])
         result = api.validate_cnpj('12.345.678/0001-95')
         self.assertTrue(result['valid'])
 
+    @patch.object(
+        CnpjAPI,
+        'fetch_company_info_async',
+        return_value={'cnpj': '11222333000181'},
+    )
+    def test_validate_cnpj_async(self, mock_fetch):
+        """Test asynchronous CNPJ validation process."""
+        api = CnpjAPI()
+        result = asyncio.run(
+            api.validate_cnpj_async(MagicMock(), '11.222.333/0001-81')
+        )
+        self.assertTrue(result['valid'])
+
+    @patch.object(
+        CnpjAPI,
+        'fetch_company_info_async',
+        return_value={'cnpj': '98765432000110'},
+    )
+    def test_validate_cnpj_async_not_found(self, mock_fetch):
+        """Test asynchronous CNPJ validation when the API returns another CNPJ."""
+        api = CnpjAPI()
+        result = asyncio.run(
+            api.validate_cnpj_async(MagicMock(), '11.222.333/0001-81')
+        )
+        self.assertFalse(result['valid'])
+
+    @patch.object(CnpjAPI, 'fetch_company_info_async')
+    def test_validate_cnpj_async_invalid_check_digits(self, mock_fetch):
+        """Test that a CNPJ with wrong check digits is not looked up."""
+        api = CnpjAPI()
+        result = asyncio.run(
+            api.validate_cnpj_async(MagicMock(), '11.222.333/0001-80')
+        )
+        self.assertFalse(result['valid'])
+        mock_fetch.assert_not_called()
+
+    @patch.object(CnpjAPI, 'fetch_company_info_async')
+    def test_validate_cnpjs_async(self, mock_fetch):
+        """Test validating several CNPJs concurrently, keeping order."""
+        mock_fetch.side_effect = lambda client, cnpj: {'cnpj': cnpj}
+        cnpjs = ['11.222.333/0001-81', '11.222.333/0001-80']
+        api = CnpjAPI(cnpj_list=cnpjs)
+        results = asyncio.run(api.validate_cnpjs_async(concurrency=2))
+        self.assertEqual([r['valid'] for r in results], [True, False])
+        mock_fetch.assert_called_once()
+
+    @patch.object(CnpjAPI, 'fetch_company_info_async')
+    def test_validate_cnpjs_async_fetches_each_cnpj_once(self, mock_fetch):
+        """Test that repeated CNPJs share one request and its failure."""
+        mock_fetch.side_effect = APIRequestError('Service unavailable.')
+        cnpjs = ['11.222.333/0001-81', '11222333000181', 'invalid']
+        api = CnpjAPI(cnpj_list=cnpjs)
+        results = asyncio.run(api.validate_cnpjs_async(MagicMock()))
+        self.assertEqual([r['cnpj'] for r in results], cnpjs)
+        self.assertEqual(
+            [r['reason'] for r in results[:2]],
+            ['Service unavailable.', 'Service unavailable.'],
+        )
+        self.assertFalse(any(r['valid'] for r in results))
+        mock_fetch.assert_called_once()
+
+    def test_validate_cnpjs_async_invalid_json(self):
+        """Test that a non-JSON response fails only its own CNPJ."""
+        client = MagicMock()
+        client.get = AsyncMock(
+            side_effect=lambda url, **kwargs: MagicMock(
+                status_code=200,
+                content=b'<html>'
+                if '45997418000153' in url
+                else b'{"cnpj": "11222333000181"}',
+            )
+        )
+        cnpjs = ['11.222.333/0001-81', '45.997.418/0001-53']
+        api = CnpjAPI(cnpj_list=cnpjs)
+        results = asyncio.run(api.validate_cnpjs_async(client))
+        self.assertEqual([r['valid'] for r in results], [True, False])
+        self.assertIn('Invalid JSON', results[1]['reason'])
+
     @patch.object(CnpjAPI, 'validate_cnpj')
     def test_validate_cnpjs(self, mock_validate_cnpj):
         """Test CNPJ validation for multiple CNPJs."""
@@ -0,0 +1,92 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+from kami_dataset_validator.concurrency import (
+    HTTP2_AVAILABLE,
+    AsyncRateLimiter,
+    create_client,
+    gather_limited,
+    get_with_backoff,
+    run_sync,
+)
+
+
+class TestAsyncRateLimiter(unittest.TestCase):
+    def test_entries_are_spaced_by_interval(self):
+        """Test that entries are scheduled one interval apart."""
+        limiter = AsyncRateLimiter(max_rate=4, time_period=0.2)
+
+        async def enter():
+            async with limiter:
+                return asyncio.get_running_loop().time()
+
+        async def run():
+            return await asyncio.gather(*(enter() for _ in range(4)))
+
+        times = run_sync(run())
+        gaps = [later - earlier for earlier, later in zip(times, times[1:])]
+        for gap in gaps:
+            self.assertGreaterEqual(gap, 0.045)
+
+    def test_invalid_rate(self):
+        """Test that a non-positive rate is rejected."""
+        with self.assertRaises(ValueError):
+            AsyncRateLimiter(max_rate=0)
+
+
+class TestGatherLimited(unittest.TestCase):
+    def test_gather_limited_keeps_order_and_bounds_concurrency(self):
+        """Test that results keep the input order under the limit."""
+        in_flight = []
+        peak = []
+
+        async def double(item):
+            in_flight.append(item)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01 * (item % 3))
+            in_flight.remove(item)
+            return item * 2
+
+        results = run_sync(gather_limited(double, range(10), concurrency=3))
+        self.assertEqual(results, [item * 2 for item in range(10)])
+        self.assertLessEqual(max(peak), 3)
+
+
+class TestCreateClient(unittest.TestCase):
+    def test_client_negotiates_http2_when_available(self):
+        """Test that the pooled client enables HTTP/2 when h2 is present."""
+        with create_client() as client:
+            self.assertEqual(client._transport._pool._http2, HTTP2_AVAILABLE)
+
+
+class TestGetWithBackoff(unittest.TestCase):
+    @staticmethod
+    def _response(status_code):
+        response = MagicMock(status_code=status_code)
+        response.headers = {}
+        return response
+
+    def test_retries_too_many_requests(self):
+        """Test that a 429 response is retried until it succeeds."""
+        client = MagicMock()
+        client.get = AsyncMock(
+            side_effect=[self._response(429), self._response(200)]
+        )
+        response = run_sync(get_with_backoff(client, 'url', backoff=0))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(client.get.await_count, 2)
+
+    def test_gives_up_after_max_retries(self):
+        """Test that the last 429 is returned once retries run out."""
+        client = MagicMock()
+        client.get = AsyncMock(return_value=self._response(429))
+        response = run_sync(
+            get_with_backoff(client, 'url', max_retries=2, backoff=0)
+        )
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(client.get.await_count, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -23,6 +23,12 @@ class TestCPFValidator(unittest.TestCase):
         validator = CPFValidator(cpf)
         self.assertTrue(validator.validate())
 
+    def test_is_valid_check_digits(self):
+        """Test that wrong or repeated check digits are rejected."""
+        self.assertTrue(CPFValidator('11144477735').is_valid())
+        self.assertFalse(CPFValidator('11144477734').is_valid())
+        self.assertFalse(CPFValidator('00000000000').is_valid())
+
     def test_validate_cpf_invalid_format(self):
         """Test CPF validation with invalid format."""
         cpf = 'invalid_cpf_format'
@@ -68,6 +74,32 @@ class TestCPFValidator(unittest.TestCase):
                 results,
             )
 
+    def test_validate_cpfs_invalid_check_digits(self):
+        """Test that a CPF with wrong check digits is reported as invalid."""
+        results = CPFValidator.validate_cpfs(['11144477734'])
+        self.assertEqual(
+            results,
+            [
+                {
+                    'cpf': '11144477734',
+                    'valid': False,
+                    'reason': 'The provided CPF is not valid.',
+                }
+            ],
+        )
+
+    def test_validate_cpfs_missing_or_non_string(self):
+        """Test that missing and non-string CPFs get domain reasons."""
+        results = CPFValidator.validate_cpfs([None, 11144477735])
+        self.assertEqual(
+            [result['reason'] for result in results],
+            [
+                'Empty CPF.',
+                'Invalid CPF format. Ensure it contains only numbers.',
+            ],
+        )
+        self.assertFalse(any(result['valid'] for result in results))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,5 +1,6 @@
+import asyncio
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from email_validator import (
     EmailNotValidError,
@@ -7,11 +8,22 @@ from email_validator import (
     EmailUndeliverableError,
 )
 
-from kami_dataset_validator.validators.email import EmailValidator
+from kami_dataset_validator.validators.email import (
+    EmailValidator,
+    _dns_resolver,
+    _prefetch_mx,
+)
 
 
 class TestEmailValidator(unittest.TestCase):
     def setUp(self):
+        prefetch_patcher = patch(
+            'kami_dataset_validator.validators.email._prefetch_mx',
+            new_callable=AsyncMock,
+        )
+        self.mock_prefetch_mx = prefetch_patcher.start()
+        self.addCleanup(prefetch_patcher.stop)
+
         self.valid_email = 'test@example.com'
         self.invalid_email_syntax = 'test@example'
         self.invalid_email_domain = 'test@invalid_domain.com'
@@ -57,7 +69,7 @@ class TestEmailValidator(unittest.TestCase):
             self.invalid_email_domain,
         ]
 
-        def side_effect_func(email, check_deliverability):
+        def side_effect_func(email, check_deliverability, dns_resolver):
             if email == self.valid_email:
                 return MagicMock(email=email, mx=True)
             elif email == self.invalid_email_syntax:
@@ -78,6 +90,57 @@ class TestEmailValidator(unittest.TestCase):
         self.assertFalse(results[1].get('deliverability', False))
         self.assertFalse(results[2].get('deliverability', False))
 
+    @patch('kami_dataset_validator.validators.email.validate_email')
+    def test_validate_emails_checks_each_email_once(self, mock_validate_email):
+        """Test that an invalid email is not checked again for its reason."""
+        mock_validate_email.side_effect = EmailUndeliverableError(
+            'Invalid email domain'
+        )
+
+        results = EmailValidator.validate_emails([self.invalid_email_domain])
+
+        self.assertEqual(mock_validate_email.call_count, 1)
+        self.assertEqual(results[0]['reason'], 'Invalid email domain')
+
+    @patch('kami_dataset_validator.validators.email.validate_email')
+    def test_validate_emails_share_dns_resolver(self, mock_validate_email):
+        """Test that every check uses the same caching DNS resolver."""
+        mock_validate_email.return_value = self.mock_valid_response
+
+        EmailValidator.validate_emails(['a@example.com', 'b@example.com'])
+
+        resolvers = [
+            call.kwargs['dns_resolver']
+            for call in mock_validate_email.call_args_list
+        ]
+        self.assertIs(resolvers[0], resolvers[1])
+        self.assertIsNotNone(resolvers[0].cache)
+
+    @patch('kami_dataset_validator.validators.email.validate_email')
+    def test_validate_emails_prefetches_each_domain(self, mock_validate_email):
+        """Test that MX records are prefetched once per distinct domain."""
+        mock_validate_email.return_value = self.mock_valid_response
+
+        EmailValidator.validate_emails(
+            ['a@example.com', 'b@Example.com', 'c@other.com', 'bad', None]
+        )
+
+        self.mock_prefetch_mx.assert_awaited_once_with(
+            {'example.com', 'other.com'}
+        )
+
+    @patch('kami_dataset_validator.validators.email.dns.asyncresolver')
+    def test_prefetch_mx_fills_shared_cache(self, mock_asyncresolver):
+        """Test that prefetching resolves every domain on the shared cache."""
+        resolver = mock_asyncresolver.Resolver.return_value
+        resolver.resolve = AsyncMock()
+
+        asyncio.run(_prefetch_mx(['example.com', 'other.com']))
+
+        self.assertEqual(resolver.resolve.await_count, 2)
+        resolver.resolve.assert_any_await('example.com', 'MX')
+        self.assertIs(resolver.cache, _dns_resolver().cache)
+
 
 if __name__ == '__main__':
     unittest.main()
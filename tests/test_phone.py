@@ -1,79 +1,81 @@
 import unittest
 from unittest.mock import patch
 
+import phonenumbers
+
 from kami_dataset_validator.validators.phone import (
     PhoneValidator,
     PhoneValueError,
+    _is_valid_number,
+    _number_type,
+    _parse,
 )
 
+PHONE_MODULE = 'kami_dataset_validator.validators.phone'
+
+
+def clear_phone_caches():
+    for cached in (_parse, _is_valid_number, _number_type):
+        cached.cache_clear()
+
 
 class TestPhoneNumberValidator(unittest.TestCase):
-    @patch('kami_dataset_validator.validators.phone.phonenumbers.parse')
-    @patch(
-        'kami_dataset_validator.validators.phone.phonenumbers.is_valid_number'
-    )
-    @patch('kami_dataset_validator.validators.phone.phonenumbers.number_type')
-    def test_validate_valid_phone_number(
-        self, mock_number_type, mock_is_valid_number, mock_parse
-    ):
-        mock_parse.return_value = True
-        mock_is_valid_number.return_value = True
-        mock_number_type.return_value = True
+    def setUp(self):
+        clear_phone_caches()
+        self.mock_parse = self._start_patch('phonenumbers.parse')
+        self.mock_is_valid_number = self._start_patch(
+            'phonenumbers.is_valid_number'
+        )
+        self.mock_number_type = self._start_patch('phonenumbers.number_type')
+
+    def _start_patch(self, target):
+        patcher = patch(f'{PHONE_MODULE}.{target}')
+        self.addCleanup(patcher.stop)
+        return patcher.start()
+
+    def test_validate_valid_phone_number(self):
+        self.mock_parse.return_value = True
+        self.mock_is_valid_number.return_value = True
+        self.mock_number_type.return_value = True
 
         phone_validator = PhoneValidator('+11234567890')
         self.assertTrue(phone_validator.validate())
         self.assertTrue(phone_validator.is_possible_mobile())
 
-    @patch('kami_dataset_validator.validators.phone.phonenumbers.parse')
-    def test_validate_invalid_phone_number_format(self, mock_parse):
-        mock_parse.side_effect = PhoneValueError(
-            'Invalid phone number format.'
+    def test_validate_invalid_phone_number_format(self):
+        parse_error = phonenumbers.NumberParseException(
+            phonenumbers.NumberParseException.NOT_A_NUMBER,
+            'Invalid phone number format.',
         )
+        self.mock_parse.side_effect = parse_error
 
-        with self.assertRaises(PhoneValueError):
-            PhoneValidator('invalid_phone_number').validate()
+        with self.assertRaises(PhoneValueError) as context:
+            PhoneValidator('+55 11 9876-5432').validate()
 
-    @patch('kami_dataset_validator.validators.phone.phonenumbers.parse')
-    @patch(
-        'kami_dataset_validator.validators.phone.phonenumbers.is_valid_number'
-    )
-    def test_validate_invalid_phone_number(
-        self, mock_is_valid_number, mock_parse
-    ):
-        mock_parse.return_value = True
-        mock_is_valid_number.return_value = False
+        self.assertTrue(self.mock_parse.called)
+        self.assertEqual(str(context.exception), str(parse_error))
+
+    def test_validate_invalid_phone_number(self):
+        self.mock_parse.return_value = True
+        self.mock_is_valid_number.return_value = False
 
         with self.assertRaises(PhoneValueError):
             phone_validator = PhoneValidator('+11234567890')
             phone_validator.validate()
 
-    @patch('kami_dataset_validator.validators.phone.phonenumbers.parse')
-    @patch(
-        'kami_dataset_validator.validators.phone.phonenumbers.is_valid_number'
-    )
-    @patch('kami_dataset_validator.validators.phone.phonenumbers.number_type')
-    def test_validate_non_mobile_phone_number(
-        self, mock_number_type, mock_is_valid_number, mock_parse
-    ):
-        mock_parse.return_value = True
-        mock_is_valid_number.return_value = True
-        mock_number_type.return_value = False
+    def test_validate_non_mobile_phone_number(self):
+        self.mock_parse.return_value = True
+        self.mock_is_valid_number.return_value = True
+        self.mock_number_type.return_value = False
 
         phone_validator = PhoneValidator('+11234567890')
         self.assertTrue(phone_validator.validate())
         self.assertFalse(phone_validator.is_possible_mobile())
 
-    @patch('kami_dataset_validator.validators.phone.phonenumbers.parse')
-    @patch(
-        'kami_dataset_validator.validators.phone.phonenumbers.is_valid_number'
-    )
-    @patch('kami_dataset_validator.validators.phone.phonenumbers.number_type')
-    def test_validate_phone_numbers(
-        self, mock_number_type, mock_is_valid_number, mock_parse
-    ):
-        mock_parse.return_value = True
-        mock_is_valid_number.return_value = True
-        mock_number_type.side_effect = [True, False]
+    def test_validate_phone_numbers(self):
+        self.mock_parse.return_value = True
+        self.mock_is_valid_number.return_value = True
+        self.mock_number_type.side_effect = [True, False]
         phone_numbers = ['+11234567890', '+14155552671']
         results = PhoneValidator.validate_phone_numbers(phone_numbers)
 
@@ -81,6 +83,123 @@ class TestPhoneNumberValidator(unittest.TestCase):
             self.assertTrue(res['valid'])
             self.assertIn(res['possible_mobile'], [True, False])
 
+    def test_validate_phone_numbers_invalid(self):
+        self.mock_parse.return_value = True
+        self.mock_is_valid_number.return_value = False
+        results = PhoneValidator.validate_phone_numbers(['+11234567890'])
+
+        self.assertFalse(results[0]['valid'])
+        self.assertFalse(results[0]['possible_mobile'])
+        self.assertEqual(
+            results[0]['reason'], 'The provided phone number is not valid.'
+        )
+
+    def test_malformed_phone_number_skips_parse(self):
+        for number in ('abc', '123', '+55 11 9123A-5678'):
+            with self.assertRaises(PhoneValueError):
+                PhoneValidator(number)
+        self.mock_parse.assert_not_called()
+
+
+class TestPhoneNumberMetadata(unittest.TestCase):
+    def setUp(self):
+        clear_phone_caches()
+
+    @patch(
+        'kami_dataset_validator.validators.phone.phonenumbers.parse',
+        wraps=phonenumbers.parse,
+    )
+    def test_repeated_phone_number_parsed_once(self, mock_parse):
+        results = PhoneValidator.validate_phone_numbers(
+            ['+5511912345678', '+5511912345678']
+        )
+
+        self.assertEqual(results[0], results[1])
+        mock_parse.assert_called_once_with('+5511912345678', None)
+
+    @patch(
+        'kami_dataset_validator.validators.phone.phonenumbers.number_type',
+        wraps=phonenumbers.number_type,
+    )
+    @patch(
+        'kami_dataset_validator.validators.phone.phonenumbers.is_valid_number',
+        wraps=phonenumbers.is_valid_number,
+    )
+    def test_repeated_phone_number_metadata_looked_up_once(
+        self, mock_is_valid_number, mock_number_type
+    ):
+        PhoneValidator.validate_phone_numbers(['+5511912345678'] * 3)
+
+        mock_is_valid_number.assert_called_once()
+        mock_number_type.assert_called_once()
+
+    @patch('kami_dataset_validator.validators.phone.PARALLEL_MIN_NUMBERS', 2)
+    def test_validate_phone_numbers_in_worker_processes(self):
+        phone_numbers = ['+5511912345678', 'bad', '+551133334444', None]
+        serial = PhoneValidator.validate_phone_numbers(
+            phone_numbers, max_workers=1
+        )
+        parallel = PhoneValidator.validate_phone_numbers(
+            phone_numbers, max_workers=2
+        )
+
+        self.assertEqual(parallel, serial)
+
+    @patch('kami_dataset_validator.validators.phone.PARALLEL_MIN_NUMBERS', 2)
+    @patch('kami_dataset_validator.validators.phone.ProcessPoolExecutor')
+    def test_validate_phone_numbers_serial_by_default(self, mock_executor):
+        results = PhoneValidator.validate_phone_numbers(
+            ['+5511912345678', 'bad', '+551133334444']
+        )
+
+        self.assertEqual([r['valid'] for r in results], [True, False, True])
+        mock_executor.assert_not_called()
+
+    def test_phone_validator_is_slotted(self):
+        phone_validator = PhoneValidator('+5511912345678')
+
+        self.assertFalse(hasattr(phone_validator, '__dict__'))
+        self.assertTrue(phone_validator.validate())
+
+    def test_validate_phone_numbers_columns(self):
+        phone_numbers = ['+5511912345678', 'bad', '+551133334444', None]
+        results = PhoneValidator.validate_phone_numbers(phone_numbers)
+        columns = PhoneValidator.validate_phone_numbers_columns(phone_numbers)
+
+        self.assertEqual(
+            columns,
+            {
+                field: [result[field] for result in results]
+                for field in ('valid', 'possible_mobile', 'reason')
+            },
+        )
+        self.assertEqual(columns['valid'], [True, False, True, False])
+
+    def test_validate_phone_numbers_loosely_formatted(self):
+        phone_numbers = [
+            '+55 (11) 9 1234 - 5678',
+            '+55 11/91234-5678',
+            '+\uff15\uff15 \uff11\uff11 \uff19\uff11\uff12\uff13\uff14'
+            '-\uff15\uff16\uff17\uff18',
+        ]
+        results = PhoneValidator.validate_phone_numbers(phone_numbers)
+
+        self.assertEqual([result['valid'] for result in results], [True] * 3)
+        self.assertTrue(all(result['possible_mobile'] for result in results))
+
+    def test_validate_phone_numbers_default_region(self):
+        national_number = '(11) 91234-5678'
+        without_region = PhoneValidator.validate_phone_numbers(
+            [national_number]
+        )
+        with_region = PhoneValidator.validate_phone_numbers(
+            [national_number], default_region='BR'
+        )
+
+        self.assertFalse(without_region[0]['valid'])
+        self.assertTrue(with_region[0]['valid'])
+        self.assertTrue(with_region[0]['possible_mobile'])
+
 
 if __name__ == '__main__':
     unittest.main()
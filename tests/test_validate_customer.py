@@ -0,0 +1,411 @@
+import tempfile
+import unittest
+from unittest.mock import AsyncMock, patch
+
+import polars as pl
+
+from kami_dataset_validator import cache
+from kami_dataset_validator.cache import get_cache
+from kami_dataset_validator.validate_customer import CustomerDataValidator
+from kami_dataset_validator.validators.cep import CepAPI
+from kami_dataset_validator.validators.cnpj import (
+    CnpjAPI,
+    CNPJValidator,
+    CNPJValueError,
+)
+from kami_dataset_validator.validators.cpf import CPFValidator
+from kami_dataset_validator.validators.email import EmailValidator
+from kami_dataset_validator.validators.phone import PhoneValidator
+
+
+def fetch_cep(client, cep):
+    return {'cep': cep}
+
+
+class TestCustomerDataValidator(unittest.TestCase):
+    def setUp(self):
+        self.dataset = pl.DataFrame(
+            {
+                'id': [1, 2, 3],
+                'cep': ['01001-000', '01001000', '20040-020'],
+                'street': ['Praça da Sé'] * 3,
+                'city': ['São Paulo', 'São Paulo', 'Rio de Janeiro'],
+                'state': ['SP', 'XX', 'RJ'],
+                'cpf': ['111.444.777-35', '11144477734', None],
+                'cnpj': ['11.222.333/0001-81', '11222333000181', ''],
+                'phone': ['+5511987654321', '123', '+5511987654321'],
+                'email': ['a@example.com', 'b@example.com', 'a@example.com'],
+                'email2': ['b@example.com', 'c@example.com', 'a@example.com'],
+            }
+        )
+
+    def _validator(self, dataset: pl.DataFrame) -> CustomerDataValidator:
+        return CustomerDataValidator(
+            dataset,
+            'id',
+            'cep',
+            'street',
+            'city',
+            'state',
+            'cpf',
+            'cnpj',
+            'phone',
+            ['email', 'email2'],
+            use_cache=False,
+        )
+
+    @patch.object(CepAPI, '_fetch_by_cep_async', new_callable=AsyncMock)
+    def test_validate_address_keeps_raw_cep(self, mock_fetch):
+        """Test that both paths report the CEP exactly as given."""
+        mock_fetch.side_effect = fetch_cep
+        validator = self._validator(self.dataset)
+
+        for external, validation in (
+            (True, [True, False, True]),
+            (False, [True] * 3),
+        ):
+            result = validator.validate_address_from_cep(external=external)
+            self.assertEqual(
+                result['cep'].to_list(), self.dataset['cep'].to_list()
+            )
+            self.assertEqual(result['cep_validation'].to_list(), validation)
+        self.assertEqual(mock_fetch.await_count, 2)
+
+    @patch.object(CepAPI, 'validate_addresses_async', autospec=True)
+    def test_validate_address_skips_malformed_ceps(self, mock_validate):
+        """Test that malformed CEPs are rejected locally and only
+        well-formed ones are sent through the rate-limited webservice."""
+        mock_validate.side_effect = lambda cep_api, **kwargs: [
+            {'valid': True, 'reason': 'Valid CEP.'} for _ in cep_api.addresses
+        ]
+        dataset = pl.DataFrame(
+            {
+                'id': [1, 2, 3, 4],
+                'cep': ['01001-000', '123', 'abcdefgh', None],
+                'street': ['Rua'] * 4,
+                'city': ['Cidade'] * 4,
+                'state': ['SP'] * 4,
+            },
+            schema_overrides={'cep': pl.Utf8},
+        )
+
+        result = self._validator(dataset).validate_address_from_cep()
+
+        mock_validate.assert_called_once()
+        cep_api = mock_validate.call_args.args[0]
+        self.assertEqual(
+            [address.cep for address in cep_api.addresses], ['01001-000']
+        )
+        self.assertEqual(
+            result['cep_validation'].to_list(), [True, False, False, False]
+        )
+        self.assertEqual(
+            result['cep_validation_reason'][1],
+            'Invalid CEP: 123. A valid CEP must have 8 numbers.',
+        )
+
+    @patch.object(CepAPI, '_fetch_by_cep_async', new_callable=AsyncMock)
+    def test_validate_address_prefilters_states(self, mock_fetch):
+        """Test that invalid UFs are rejected before any request, while
+        empty and lower-case UFs are accepted, and that the local path keeps
+        ignoring the state."""
+        mock_fetch.side_effect = fetch_cep
+        dataset = pl.DataFrame(
+            {
+                'id': [1, 2, 3, 4, 5],
+                'cep': [
+                    '01001-000',
+                    '01310-100',
+                    '20040-020',
+                    '30130-010',
+                    '40020-000',
+                ],
+                'street': ['Rua'] * 5,
+                'city': ['Cidade'] * 5,
+                'state': ['sp', '', 'XX', ' rj ', None],
+            },
+            schema_overrides={'state': pl.Utf8},
+        )
+        validator = self._validator(dataset)
+
+        result = validator.validate_address_from_cep(external=True)
+        self.assertEqual(
+            result['cep_validation'].to_list(),
+            [True, True, False, True, True],
+        )
+        self.assertEqual(
+            result['cep_validation_reason'][2], 'Invalid State: XX.'
+        )
+
+        result = validator.validate_address_from_cep(external=False)
+        self.assertEqual(result['cep_validation'].to_list(), [True] * 5)
+        self.assertEqual(
+            sorted(call.args[1] for call in mock_fetch.await_args_list),
+            ['01001000', '01310100', '30130010', '40020000'],
+        )
+
+    @patch.object(EmailValidator, 'validate_emails')
+    def test_validate_emails_checks_each_address_once(self, mock_validate):
+        """Test that an email repeated across columns is validated once and
+        its result reaches every row holding it."""
+        mock_validate.side_effect = lambda emails: [
+            {
+                'email': email,
+                'valid': email != 'c@example.com',
+                'deliverability': True,
+                'reason': email,
+            }
+            for email in emails
+        ]
+
+        result = self._validator(self.dataset).validate_emails()
+
+        mock_validate.assert_called_once_with(
+            ['a@example.com', 'b@example.com', 'c@example.com']
+        )
+        self.assertEqual(
+            result['email_validation_reason'].to_list(),
+            self.dataset['email'].to_list(),
+        )
+        self.assertEqual(
+            result['email2_validation_reason'].to_list(),
+            self.dataset['email2'].to_list(),
+        )
+        self.assertEqual(
+            result['email2_validation'].to_list(), [True, False, True]
+        )
+
+    def test_validate_phones_checks_each_number_once(self):
+        """Test that a repeated phone is validated once and its result
+        reaches every row holding it."""
+        with patch.object(
+            PhoneValidator,
+            'validate_phone_numbers_columns',
+            wraps=PhoneValidator.validate_phone_numbers_columns,
+        ) as mock_validate:
+            result = self._validator(self.dataset).validate_phones()
+
+        mock_validate.assert_called_once_with(['+5511987654321', '123'], None)
+        self.assertEqual(
+            result['phone_validation'].to_list(), [True, False, True]
+        )
+        self.assertEqual(
+            result['possible_mobile'][0], result['possible_mobile'][2]
+        )
+
+    @patch.object(CnpjAPI, 'fetch_company_info_async', new_callable=AsyncMock)
+    @patch.object(CepAPI, '_fetch_by_cep_async', new_callable=AsyncMock)
+    @patch.object(EmailValidator, 'validate_emails')
+    def test_validate_dataset_columns(
+        self, mock_emails, mock_fetch_cep, mock_fetch_cnpj
+    ):
+        """Test that the combined frame keeps one row per customer and the
+        columns of each field in the order they are requested."""
+        mock_fetch_cep.side_effect = fetch_cep
+        mock_fetch_cnpj.side_effect = lambda client, cnpj: {'cnpj': cnpj}
+        mock_emails.side_effect = lambda emails: [
+            {
+                'email': email,
+                'valid': True,
+                'deliverability': True,
+                'reason': '',
+            }
+            for email in emails
+        ]
+
+        result = self._validator(self.dataset).validate_dataset()
+
+        self.assertEqual(result.height, self.dataset.height)
+        self.assertEqual(result['id'].to_list(), [1, 2, 3])
+        self.assertEqual(
+            result.columns,
+            [
+                'id',
+                'cep',
+                'cep_validation',
+                'cep_validation_reason',
+                'cnpj',
+                'cnpj_validation',
+                'cnpj_validation_reason',
+                'cpf',
+                'cpf_validation',
+                'cpf_validation_reason',
+                'phone',
+                'phone_validation',
+                'phone_validation_reason',
+                'possible_mobile',
+                'email',
+                'email_validation',
+                'email_validation_reason',
+                'email_deliverability',
+                'email2',
+                'email2_validation',
+                'email2_validation_reason',
+                'email2_deliverability',
+            ],
+        )
+        self.assertEqual(
+            result['cnpj_validation'].to_list(), [True, True, False]
+        )
+        self.assertEqual(mock_fetch_cnpj.await_count, 1)
+
+
+class TestDocumentCheckDigits(unittest.TestCase):
+    """The Polars check-digit expressions must agree with the validators."""
+
+    cpfs = [
+        '11144477735',
+        '111.444.777-35',
+        '529.982.247-25',
+        '111.444.777-34',
+        '52998224724',
+        '000.000.000-00',
+        '99999999999',
+        '',
+        None,
+        '1114447773',
+        '111444777350',
+        'abc.def.ghi-jk',
+        '\u0661\u0661\u0661\u0664\u0664\u0664\u0667\u0667\u0667'
+        '\u0663\u0665',
+        '1114447773\uff15',
+    ]
+    cnpjs = [
+        '11222333000181',
+        '11.222.333/0001-81',
+        '45.997.418/0001-53',
+        '11.222.333/0001-80',
+        '45997418000154',
+        '00.000.000/0000-00',
+        '99999999999999',
+        '',
+        None,
+        '1122233300018',
+        '112223330001810',
+        'invalid_cnpj',
+        '\u0661\u0661\u0662\u0662\u0662\u0663\u0663\u0663\u0660'
+        '\u0660\u0660\u0661\u0668\u0661',
+        '1122233300018\uff11',
+    ]
+
+    def _validator(self, dataset: pl.DataFrame) -> CustomerDataValidator:
+        return CustomerDataValidator(
+            dataset, 'id', None, None, None, None, 'cpf', 'cnpj', None, None
+        )
+
+    @staticmethod
+    def _cnpj_verdict(cnpj):
+        try:
+            result = CNPJValidator(cnpj).validate()
+        except CNPJValueError as e:
+            return False, str(e)
+        return result['valid'], result['reason']
+
+    def test_validate_cpfs_matches_cpf_validator(self):
+        """Test that every CPF gets the same verdict as CPFValidator."""
+        dataset = pl.DataFrame(
+            {'id': range(len(self.cpfs)), 'cpf': self.cpfs, 'cnpj': None},
+            schema_overrides={'cpf': pl.Utf8, 'cnpj': pl.Utf8},
+        )
+        result = self._validator(dataset).validate_cpfs()
+        expected = CPFValidator.validate_cpfs(self.cpfs)
+
+        self.assertEqual(
+            result['cpf_validation'].to_list(),
+            [verdict['valid'] for verdict in expected],
+        )
+        self.assertEqual(
+            result['cpf_validation_reason'].to_list(),
+            [verdict['reason'] for verdict in expected],
+        )
+        self.assertEqual(
+            result['cpf_validation'].to_list()[:3], [True, True, True]
+        )
+
+    def test_validate_cnpjs_matches_cnpj_validator(self):
+        """Test that every CNPJ gets the same verdict as CNPJValidator."""
+        dataset = pl.DataFrame(
+            {'id': range(len(self.cnpjs)), 'cpf': None, 'cnpj': self.cnpjs},
+            schema_overrides={'cpf': pl.Utf8, 'cnpj': pl.Utf8},
+        )
+        result = self._validator(dataset).validate_cnpjs(external=False)
+        expected = [self._cnpj_verdict(cnpj) for cnpj in self.cnpjs]
+
+        self.assertEqual(
+            list(
+                zip(
+                    result['cnpj_validation'].to_list(),
+                    result['cnpj_validation_reason'].to_list(),
+                )
+            ),
+            expected,
+        )
+        self.assertEqual(
+            result['cnpj_validation'].to_list()[:3], [True, True, True]
+        )
+
+
+class TestCustomerDataValidatorCache(unittest.TestCase):
+    def setUp(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        patcher = patch.object(cache, 'CACHE_DIR', cache_dir.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        get_cache.cache_clear()
+        self.addCleanup(get_cache.cache_clear)
+        self.addCleanup(lambda: get_cache('cnpj').close())
+        self.dataset = pl.DataFrame({'id': [1], 'cnpj': ['11222333000181']})
+        self.results = {
+            '11222333000181': {
+                'cnpj': '11222333000181',
+                'valid': True,
+                'reason': 'Valid CNPJ.',
+                'company_info': {'razao_social': 'ACME LTDA'},
+            },
+            '11222333000180': {'valid': False, 'reason': 'Invalid CNPJ.'},
+        }
+
+    def _validator(self, **kwargs) -> CustomerDataValidator:
+        return CustomerDataValidator(
+            self.dataset,
+            'id',
+            None,
+            None,
+            None,
+            None,
+            None,
+            'cnpj',
+            None,
+            None,
+            **kwargs,
+        )
+
+    def test_cache_disabled_by_default(self):
+        """Test that nothing is written to disk unless asked for."""
+        validator = self._validator()
+        validator._write_cache('cnpj', 'brasilapi', self.results)
+
+        self.assertEqual(len(get_cache('cnpj')), 0)
+        self.assertEqual(
+            validator._read_cache('cnpj', 'brasilapi', list(self.results)),
+            {},
+        )
+
+    def test_write_cache_stores_only_valid_verdicts(self):
+        """Test that only the verdict of valid results is persisted."""
+        validator = self._validator(use_cache=True)
+        validator._write_cache('cnpj', 'brasilapi', self.results)
+
+        self.assertEqual(
+            validator._read_cache('cnpj', 'brasilapi', list(self.results)),
+            {'11222333000181': {'valid': True, 'reason': 'Valid CNPJ.'}},
+        )
+        self.assertEqual(
+            validator._read_cache('cnpj', 'receitaws', list(self.results)),
+            {},
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()